@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache for analysis results
+Lets the analyze_* scripts skip the full pipeline (Excel parsing, news
+fetching, LLM analysis) when the input file has not changed
+"""
+
+import hashlib
+import json
+import os
+from datetime import date
+
+CACHE_DIR = "cache"
+
+def file_digest(filepath):
+    """Compute a fast content hash of a file for use as a cache key"""
+    with open(filepath, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashes in fixed-size blocks entirely at C speed
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+        h = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+def cache_path_for(filepath):
+    """Return the cache file path for a given input file
+
+    The key combines the file's content hash with the current date, so a
+    cached analysis is reused for identical inputs within the same day
+    but naturally expires once the news it was built on goes stale
+    """
+    return os.path.join(CACHE_DIR, f"{file_digest(filepath)}_{date.today().isoformat()}.json")
+
+def load_cached_analysis(filepath, model):
+    """
+    Return a cached analysis for filepath parsed into the given Pydantic
+    model, or None when no valid cache entry exists
+    """
+    cache_file = cache_path_for(filepath)
+
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file) as f:
+                return model(**json.load(f))
+        except Exception:
+            # Corrupt or stale cache entry - fall through to a fresh run
+            return None
+
+    return None
+
+def save_cached_analysis(filepath, results):
+    """Store analysis results keyed by the input file's content hash"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_file = cache_path_for(filepath)
+    results.to_json(cache_file)
+    return cache_file
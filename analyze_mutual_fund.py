@@ -4,70 +4,63 @@ Interactive Mutual Fund Analyzer
 This script allows users to choose a mutual fund file to analyze
 """
 
+import argparse
+import functools
+import heapq
+import io
+import operator
 import os
 import sys
-from mutual_fund_analyzer import MutualFundAnalyzer
+from collections import Counter
 
-def list_mutual_fund_files():
-    """List mutual fund files in the samples directory"""
-    samples_dir = "samples"
-    files = []
-    
-    if os.path.exists(samples_dir):
-        for file in os.listdir(samples_dir):
-            if file.endswith(".xlsx"):
-                files.append(os.path.join(samples_dir, file))
-    
-    return files
+from cli_utils import is_excel_file, list_xlsx_files, select_file
 
-def select_file(files):
-    """Let user select a file or provide their own"""
-    print("\nAvailable mutual fund files:")
-    for i, file in enumerate(files, 1):
-        print(f"{i}. {os.path.basename(file)}")
-    
-    print(f"{len(files) + 1}. Use my own file (provide path)")
-    
-    while True:
-        try:
-            choice = input("\nEnter your choice (number): ")
-            choice = int(choice.strip())
-            
-            if 1 <= choice <= len(files):
-                return files[choice - 1]
-            elif choice == len(files) + 1:
-                while True:
-                    file_path = input("Enter the full path to your Excel file: ").strip()
-                    if os.path.exists(file_path) and file_path.endswith(".xlsx"):
-                        return file_path
-                    else:
-                        print("File not found or not an Excel file. Please try again.")
-            else:
-                print("Invalid choice. Please try again.")
-        
-        except ValueError:
-            print("Please enter a number.")
+def parse_args():
+    """Command line options so the script can run without any prompts"""
+    parser = argparse.ArgumentParser(
+        description="Analyze a mutual fund Excel file with AI impact assessment")
+    parser.add_argument("--file", "-f", help="Excel file to analyze (skips the interactive picker)")
+    parser.add_argument("--output", "-o", help="Output JSON path (default: <input>_analysis.json)")
+    parser.add_argument("--no-prompt", action="store_true",
+                        help="Answer 'n' to every interactive prompt")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run the analysis even when a cached result exists")
+    return parser.parse_args()
+
+DEFAULT_LLM_API_KEY = "xai-L9NtX3VBbiKDNisc12yssrysUYw3KZt4JFlKzfcmLeJyEWums01fMVPmw2LspuqQcq9I1iL42ITnthVq"
+
+@functools.cache
+def load_api_keys():
+    """Load API keys, parsing .env at most once per process and skipping
+    the disk read entirely when the keys are already in the environment"""
+    if "NEWS_API_KEY" not in os.environ:
+        from dotenv import load_dotenv
+        load_dotenv()
+
+    return {
+        "NEWS_API_KEY": os.getenv("NEWS_API_KEY"),
+        "LLM_API_KEY": os.getenv("LLM_API_KEY", DEFAULT_LLM_API_KEY),
+    }
 
 def main():
     """Main function for interactive mutual fund analysis"""
+    args = parse_args()
+
     print("=" * 60)
     print("Mutual Fund Portfolio Analyzer with AI Impact Assessment".center(60))
     print("=" * 60)
-    
+
     # Check for API keys
-    from dotenv import load_dotenv
-    import os
-    
-    load_dotenv()
-    news_api_key = os.getenv("NEWS_API_KEY")
-    llm_api_key = os.getenv("LLM_API_KEY", "xai-L9NtX3VBbiKDNisc12yssrysUYw3KZt4JFlKzfcmLeJyEWums01fMVPmw2LspuqQcq9I1iL42ITnthVq")
-    
+    keys = load_api_keys()
+    news_api_key = keys["NEWS_API_KEY"]
+    llm_api_key = keys["LLM_API_KEY"]
+
     if not news_api_key:
         print("\nWARNING: No NewsAPI key found in .env file.")
         print("You need a NewsAPI.org API key to fetch news.")
         print("Please add your key to the .env file: NEWS_API_KEY=your_key_here")
-        
-        setup_key = input("\nWould you like to enter your NewsAPI key now? (y/n): ").lower()
+
+        setup_key = 'n' if args.no_prompt else input("\nWould you like to enter your NewsAPI key now? (y/n): ").lower()
         if setup_key == 'y':
             news_api_key = input("Enter your NewsAPI.org API key: ").strip()
             
@@ -80,11 +73,22 @@ def main():
         else:
             print("News analysis may be limited without an API key.")
     
-    # Check if we have sample files, if not, offer to create them
-    mutual_fund_files = list_mutual_fund_files()
-    
+    # A file given on the command line skips the interactive picker entirely
+    if args.file:
+        if not is_excel_file(args.file):
+            print(f"Error: File not found or not an Excel file: {args.file}")
+            return
+        selected_file = args.file
+        mutual_fund_files = [args.file]
+    else:
+        # Check if we have sample files, if not, offer to create them
+        mutual_fund_files = list_xlsx_files()
+
     if not mutual_fund_files:
         print("\nNo sample mutual fund files found.")
+        if args.no_prompt:
+            print("Pass --file to analyze a specific Excel file. Exiting.")
+            return
         create_samples = input("Would you like to create sample mutual fund files for testing? (y/n): ").lower()
         
         if create_samples == 'y':
@@ -96,12 +100,12 @@ def main():
             create_banking_fund_sample()
             
             print("Sample files created successfully.")
-            mutual_fund_files = list_mutual_fund_files()
+            mutual_fund_files = list_xlsx_files()
         else:
             print("Please provide your own mutual fund Excel file.")
             while True:
                 file_path = input("Enter the full path to your Excel file: ").strip()
-                if os.path.exists(file_path) and file_path.endswith(".xlsx"):
+                if is_excel_file(file_path):
                     selected_file = file_path
                     break
                 else:
@@ -110,26 +114,46 @@ def main():
             if not selected_file:
                 print("No valid file provided. Exiting.")
                 return
-    else:
+    elif not args.file:
         # Let user select a file
-        selected_file = select_file(mutual_fund_files)
+        selected_file = select_file(mutual_fund_files, "mutual fund")
     
     # Create and run the analyzer
     try:
+        # Deferred imports: the analyzer drags in pandas/openpyxl/requests,
+        # which is wasted work when the user exits at the prompts above
+        from mutual_fund_analyzer import MutualFundAnalyzer, MutualFundAnalysis
+        from analysis_cache import load_cached_analysis, save_cached_analysis
+
+        # One analyzer per (key pair) for the whole session, so repeated
+        # analyses reuse its pooled HTTP connections
+        @functools.lru_cache(maxsize=1)
+        def get_analyzer(news_key, llm_key):
+            return MutualFundAnalyzer(news_api_key=news_key, llm_api_key=llm_key)
+
         print(f"\nAnalyzing mutual fund: {os.path.basename(selected_file)}")
         
         # Create visualizations directory if it doesn't exist
         os.makedirs("visualizations", exist_ok=True)
         
-        # Initialize analyzer with API keys
-        analyzer = MutualFundAnalyzer(news_api_key=news_api_key, llm_api_key=llm_api_key)
-        
-        # Analyze the mutual fund
-        results = analyzer.analyze_from_excel(selected_file)
+        # Reuse a cached analysis when the input file is unchanged
+        results = None
+        if not args.force:
+            results = load_cached_analysis(selected_file, MutualFundAnalysis)
+
+        if results is not None:
+            print("Using cached analysis (input unchanged; pass --force to re-analyze).")
+        else:
+            # Initialize analyzer with API keys
+            analyzer = get_analyzer(news_api_key, llm_api_key)
+
+            # Analyze the mutual fund
+            results = analyzer.analyze_from_excel(selected_file)
+            save_cached_analysis(selected_file, results)
         
         # Generate output filename based on input
         base_name = os.path.basename(selected_file).split('.')[0]
-        output_path = f"{base_name}_analysis.json"
+        output_path = args.output or f"{base_name}_analysis.json"
         
         # Save results
         results.to_json(output_path)
@@ -138,39 +162,43 @@ def main():
         print("\nGenerating visualizations...")
         viz_paths = results.generate_visualizations("visualizations")
         
-        # Display results summary
-        print(f"\nMutual Fund Analysis Complete!")
-        print(f"Results saved to {output_path}")
-        print(f"Visualizations saved to visualizations/ directory")
-        
-        # Print fund summary
-        print(f"\n{results.fund_name} - Analysis Summary")
-        print(f"Holdings: {results.holdings_count}")
-        
-        # Sector allocation (top 5)
-        print("\nTop Sectors:")
-        for sector, pct in sorted(results.sector_exposure.items(), key=lambda x: x[1], reverse=True)[:5]:
-            print(f"{sector}: {pct:.2f}%")
-        
+        # Display results summary; assemble it in one buffer so the whole
+        # block hits stdout as a single write instead of dozens of prints
+        buf = io.StringIO()
+        buf.write(f"\nMutual Fund Analysis Complete!\n")
+        buf.write(f"Results saved to {output_path}\n")
+        buf.write("Visualizations saved to visualizations/ directory\n")
+
+        # Fund summary
+        buf.write(f"\n{results.fund_name} - Analysis Summary\n")
+        buf.write(f"Holdings: {results.holdings_count}\n")
+
+        # Sector allocation (top 5) - nlargest avoids sorting the whole dict
+        buf.write("\nTop Sectors:\n")
+        for sector, pct in heapq.nlargest(5, results.sector_exposure.items(), key=operator.itemgetter(1)):
+            buf.write(f"{sector}: {pct:.2f}%\n")
+
         # Top 5 holdings
-        print("\nTop 5 Holdings:")
+        buf.write("\nTop 5 Holdings:\n")
         for i, holding in enumerate(results.top_holdings[:5], 1):
-            print(f"{i}. {holding.name}: {holding.percentage:.2f}%")
-        
+            buf.write(f"{i}. {holding.name}: {holding.percentage:.2f}%\n")
+
         # News impact summary
-        impact_counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
-        for analysis in results.stock_analyses:
-            impact_counts[analysis.impact] += 1
-        
-        print("\nNews Impact Summary:")
+        impact_counts = Counter(analysis.impact for analysis in results.stock_analyses)
+
+        buf.write("\nNews Impact Summary:\n")
         total = sum(impact_counts.values())
-        for impact, count in impact_counts.items():
-            if total > 0:
-                percentage = (count / total) * 100
-                print(f"{impact}: {count} holdings ({percentage:.1f}%)")
+        # One division up front instead of a branch and divide per impact
+        pct_scale = 100.0 / total if total else 0.0
+        for impact in ("Positive", "Negative", "Neutral"):
+            count = impact_counts[impact]
+            buf.write(f"{impact}: {count} holdings ({count * pct_scale:.1f}%)\n")
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         
         # Ask if user wants to see AI analysis
-        show_ai = input("\nShow detailed AI analysis? (y/n): ").lower()
+        show_ai = 'n' if args.no_prompt else input("\nShow detailed AI analysis? (y/n): ").lower()
         if show_ai == 'y':
             print("\nAI Impact Analysis:")
             print(f"Overall Impact: {results.llm_analysis.impact}")
@@ -189,23 +217,26 @@ def main():
                 print(f"{i}. {opp}")
         
         # Ask if user wants to see news for specific holdings
-        show_news = input("\nShow news for specific holdings? (y/n): ").lower()
+        show_news = 'n' if args.no_prompt else input("\nShow news for specific holdings? (y/n): ").lower()
         if show_news == 'y':
+            # Slice once up front; the menu contents never change inside the loop
+            top_holdings_menu = results.stock_analyses[:15]
+            menu_size = len(top_holdings_menu)
             while True:
                 print("\nAvailable holdings:")
-                for i, analysis in enumerate(results.stock_analyses[:15], 1):
+                for i, analysis in enumerate(top_holdings_menu, 1):
                     print(f"{i}. {analysis.stock} ({analysis.impact})")
-                
+
                 print("0. Exit")
-                
+
                 try:
                     holding_choice = int(input("\nEnter holding number to view news (0 to exit): "))
-                    
+
                     if holding_choice == 0:
                         break
-                    
-                    if 1 <= holding_choice <= len(results.stock_analyses[:15]):
-                        selected = results.stock_analyses[holding_choice - 1]
+
+                    if 1 <= holding_choice <= menu_size:
+                        selected = top_holdings_menu[holding_choice - 1]
                         
                         print(f"\nNews for {selected.stock}:")
                         print(f"Main: {selected.news_summary}")
@@ -3,31 +3,51 @@
 Example script to analyze your portfolio
 """
 
-from portfolio_analyzer import PortfolioAnalyzer
+from portfolio_analyzer import PortfolioAnalyzer, PortfolioAnalysis
+from analysis_cache import load_cached_analysis, save_cached_analysis
+import argparse
 import os
 
+def parse_args():
+    """Command line options for scripted runs"""
+    parser = argparse.ArgumentParser(description="Analyze a sample portfolio Excel file")
+    parser.add_argument("--file", "-f", help="Excel file to analyze (default: samples/sample_portfolio.xlsx)")
+    parser.add_argument("--output", "-o", help="Output JSON path")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run the analysis even when a cached result exists")
+    return parser.parse_args()
+
 def main():
     """Main function to analyze a sample portfolio"""
+    args = parse_args()
+
     # Path to your portfolio Excel file
     samples_dir = "samples"
-    
+
     # List available sample files
     print("Available sample portfolio files:")
     for i, file in enumerate(os.listdir(samples_dir), 1):
         if file.endswith(".xlsx"):
             print(f"{i}. {file}")
-    
-    # Create analyzer instance
-    analyzer = PortfolioAnalyzer()
-    
+
     # Default to the Groww-like sample
-    portfolio_file = os.path.join(samples_dir, "sample_portfolio.xlsx")
-    
-    # Analyze the portfolio
-    results = analyzer.analyze_from_excel(portfolio_file)
+    portfolio_file = args.file or os.path.join(samples_dir, "sample_portfolio.xlsx")
+
+    # Reuse a cached analysis when the input file is unchanged
+    results = None
+    if not args.force:
+        results = load_cached_analysis(portfolio_file, PortfolioAnalysis)
+
+    if results is None:
+        # Create analyzer instance and analyze the portfolio
+        analyzer = PortfolioAnalyzer()
+        results = analyzer.analyze_from_excel(portfolio_file)
+        save_cached_analysis(portfolio_file, results)
+    else:
+        print("Using cached analysis (input unchanged; pass --force to re-analyze).")
     
     # Save results to JSON
-    output_path = "my_portfolio_analysis.json"
+    output_path = args.output or "my_portfolio_analysis.json"
     results.to_json(output_path)
     
     # Display results summary
@@ -4,69 +4,55 @@ Interactive Portfolio Analyzer
 This script allows users to choose a portfolio file to analyze
 """
 
+import argparse
+import functools
+import io
 import os
 import sys
-from portfolio_analyzer import PortfolioAnalyzer
+from collections import Counter
 
-def list_portfolio_files():
-    """List portfolio files in the samples directory"""
-    samples_dir = "samples"
-    files = []
-    
-    if os.path.exists(samples_dir):
-        for file in os.listdir(samples_dir):
-            if file.endswith(".xlsx"):
-                files.append(os.path.join(samples_dir, file))
-    
-    return files
+from cli_utils import is_excel_file, list_xlsx_files, select_file
 
-def select_file(files):
-    """Let user select a file or provide their own"""
-    print("\nAvailable portfolio files:")
-    for i, file in enumerate(files, 1):
-        print(f"{i}. {os.path.basename(file)}")
-    
-    print(f"{len(files) + 1}. Use my own file (provide path)")
-    
-    while True:
-        try:
-            choice = input("\nEnter your choice (number): ")
-            choice = int(choice.strip())
-            
-            if 1 <= choice <= len(files):
-                return files[choice - 1]
-            elif choice == len(files) + 1:
-                while True:
-                    file_path = input("Enter the full path to your Excel file: ").strip()
-                    if os.path.exists(file_path) and file_path.endswith(".xlsx"):
-                        return file_path
-                    else:
-                        print("File not found or not an Excel file. Please try again.")
-            else:
-                print("Invalid choice. Please try again.")
-        
-        except ValueError:
-            print("Please enter a number.")
+def parse_args():
+    """Command line options so the script can run without any prompts"""
+    parser = argparse.ArgumentParser(description="Analyze a stock portfolio Excel file")
+    parser.add_argument("--file", "-f", help="Excel file to analyze (skips the interactive picker)")
+    parser.add_argument("--output", "-o", help="Output JSON path (default: <input>_analysis.json)")
+    parser.add_argument("--no-prompt", action="store_true",
+                        help="Answer 'n' to every interactive prompt")
+    parser.add_argument("--show-details", action="store_true",
+                        help="Print the detailed per-stock results without asking")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run the analysis even when a cached result exists")
+    return parser.parse_args()
+
+@functools.cache
+def load_api_key():
+    """Load the NewsAPI key, parsing .env at most once per process and
+    skipping the disk read when the key is already in the environment"""
+    if "NEWS_API_KEY" not in os.environ:
+        from dotenv import load_dotenv
+        load_dotenv()
+
+    return os.getenv("NEWS_API_KEY")
 
 def main():
     """Main function for interactive portfolio analysis"""
+    args = parse_args()
+
     print("=" * 50)
     print("Portfolio News Analyzer".center(50))
     print("=" * 50)
     
     # Check for API key
-    from dotenv import load_dotenv
-    import os
-    
-    load_dotenv()
-    api_key = os.getenv("NEWS_API_KEY")
-    
+    api_key = load_api_key()
+
     if not api_key:
         print("\nWARNING: No NewsAPI key found in .env file.")
         print("You need a NewsAPI.org API key to fetch news.")
         print("Please add your key to the .env file: NEWS_API_KEY=your_key_here")
-        
-        setup_key = input("\nWould you like to enter your API key now? (y/n): ").lower()
+
+        setup_key = 'n' if args.no_prompt else input("\nWould you like to enter your API key now? (y/n): ").lower()
         if setup_key == 'y':
             api_key = input("Enter your NewsAPI.org API key: ").strip()
             with open(".env", "w") as f:
@@ -76,52 +62,80 @@ def main():
             print("You can add your API key later by editing the .env file.")
             return
     
-    # List portfolio files
-    portfolio_files = list_portfolio_files()
-    
-    if not portfolio_files:
-        print("\nNo sample portfolio files found.")
-        print("Please create a sample portfolio first by running:")
-        print("python3 create_sample_portfolio.py")
-        return
-    
-    # Let user select a file
-    selected_file = select_file(portfolio_files)
+    # A file given on the command line skips the interactive picker entirely
+    if args.file:
+        if not is_excel_file(args.file):
+            print(f"Error: File not found or not an Excel file: {args.file}")
+            return
+        selected_file = args.file
+    else:
+        # List portfolio files
+        portfolio_files = list_xlsx_files()
+
+        if not portfolio_files:
+            print("\nNo sample portfolio files found.")
+            print("Please create a sample portfolio first by running:")
+            print("python3 create_sample_portfolio.py")
+            return
+
+        # Let user select a file
+        selected_file = select_file(portfolio_files)
     
     # Create and run the analyzer
     try:
+        # Deferred imports: the analyzer drags in pandas/openpyxl/requests,
+        # which is wasted work when the user exits at the prompts above
+        from portfolio_analyzer import PortfolioAnalyzer, PortfolioAnalysis
+        from analysis_cache import load_cached_analysis, save_cached_analysis
+
         print(f"\nAnalyzing portfolio: {os.path.basename(selected_file)}")
         
-        analyzer = PortfolioAnalyzer(api_key=api_key)
-        results = analyzer.analyze_from_excel(selected_file)
+        # Reuse a cached analysis when the input file is unchanged
+        results = None
+        if not args.force:
+            results = load_cached_analysis(selected_file, PortfolioAnalysis)
+
+        if results is None:
+            analyzer = PortfolioAnalyzer(api_key=api_key)
+            results = analyzer.analyze_from_excel(selected_file)
+            save_cached_analysis(selected_file, results)
+        else:
+            print("Using cached analysis (input unchanged; pass --force to re-analyze).")
         
         # Generate output filename based on input
         base_name = os.path.basename(selected_file).split('.')[0]
-        output_path = f"{base_name}_analysis.json"
+        output_path = args.output or f"{base_name}_analysis.json"
         
         # Save results
         results.to_json(output_path)
         
-        # Display results summary
-        print(f"\nPortfolio Analysis Complete!")
-        print(f"Results saved to {output_path}")
-        
-        # Print number of stocks analyzed
+        # Display results summary; assemble it in one buffer so the whole
+        # block hits stdout as a single write instead of one per line
+        buf = io.StringIO()
+        buf.write(f"\nPortfolio Analysis Complete!\n")
+        buf.write(f"Results saved to {output_path}\n")
+
+        # Number of stocks analyzed
         stock_count = len(results.stocks)
-        print(f"\nAnalyzed {stock_count} stocks:")
-        
+        buf.write(f"\nAnalyzed {stock_count} stocks:\n")
+
         # Counts by impact
-        impact_counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
-        for stock in results.stocks:
-            impact_counts[stock.impact] += 1
-        
-        # Print impact summary
-        print(f"  Positive: {impact_counts['Positive']}")
-        print(f"  Negative: {impact_counts['Negative']}")
-        print(f"  Neutral: {impact_counts['Neutral']}")
+        impact_counts = Counter(stock.impact for stock in results.stocks)
+
+        buf.write(f"  Positive: {impact_counts['Positive']}\n")
+        buf.write(f"  Negative: {impact_counts['Negative']}\n")
+        buf.write(f"  Neutral: {impact_counts['Neutral']}\n")
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         
         # Ask if user wants to see detailed results
-        show_details = input("\nShow detailed results? (y/n): ").lower()
+        if args.show_details:
+            show_details = 'y'
+        elif args.no_prompt:
+            show_details = 'n'
+        else:
+            show_details = input("\nShow detailed results? (y/n): ").lower()
         if show_details == 'y':
             print("\nDetailed Analysis Results:")
             for stock in results.stocks:
@@ -3,23 +3,43 @@
 Script to analyze a Zerodha-format portfolio
 """
 
-from portfolio_analyzer import PortfolioAnalyzer
+from portfolio_analyzer import PortfolioAnalyzer, PortfolioAnalysis
+from analysis_cache import load_cached_analysis, save_cached_analysis
+import argparse
 import os
 
+def parse_args():
+    """Command line options for scripted runs"""
+    parser = argparse.ArgumentParser(description="Analyze a Zerodha-format portfolio Excel file")
+    parser.add_argument("--file", "-f", help="Excel file to analyze (default: samples/sample_zerodha_portfolio.xlsx)")
+    parser.add_argument("--output", "-o", help="Output JSON path")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run the analysis even when a cached result exists")
+    return parser.parse_args()
+
 def main():
     """Main function to analyze a Zerodha-format portfolio"""
+    args = parse_args()
+
     # Path to the Zerodha-format portfolio file
-    portfolio_file = "samples/sample_zerodha_portfolio.xlsx"
+    portfolio_file = args.file or "samples/sample_zerodha_portfolio.xlsx"
     
-    # Create analyzer instance
-    analyzer = PortfolioAnalyzer()
-    
-    # Analyze the portfolio
+    # Reuse a cached analysis when the input file is unchanged
     print(f"Analyzing Zerodha-format portfolio: {portfolio_file}")
-    results = analyzer.analyze_from_excel(portfolio_file)
+    results = None
+    if not args.force:
+        results = load_cached_analysis(portfolio_file, PortfolioAnalysis)
+
+    if results is None:
+        # Create analyzer instance and analyze the portfolio
+        analyzer = PortfolioAnalyzer()
+        results = analyzer.analyze_from_excel(portfolio_file)
+        save_cached_analysis(portfolio_file, results)
+    else:
+        print("Using cached analysis (input unchanged; pass --force to re-analyze).")
     
     # Save results to JSON
-    output_path = "zerodha_portfolio_analysis.json"
+    output_path = args.output or "zerodha_portfolio_analysis.json"
     results.to_json(output_path)
     
     # Display results summary
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the interactive command line scripts
+"""
+
+import functools
+import os
+
+# Excel suffixes we accept, compared case-insensitively so uppercase
+# broker exports (.XLSX) are not silently skipped
+SUFFIXES = (".xlsx", ".xlsm")
+
+def is_excel_file(path):
+    """Check that a user-supplied path exists and looks like an Excel file"""
+    return os.path.exists(path) and path.lower().endswith(SUFFIXES)
+
+@functools.lru_cache(maxsize=8)
+def _scan_xlsx_files(directory, mtime_ns):
+    """Scan a directory for Excel files, cached on the directory's mtime"""
+    with os.scandir(directory) as it:
+        return [entry.path for entry in it
+                if entry.is_file() and entry.name.lower().endswith(SUFFIXES)]
+
+def list_xlsx_files(directory="samples"):
+    """List Excel files in a directory, reusing the cached scan while the
+    directory is unchanged"""
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return []
+
+    return _scan_xlsx_files(directory, mtime_ns)
+
+def select_file(files, label="portfolio"):
+    """Let user select a file or provide their own"""
+    print(f"\nAvailable {label} files:")
+    for i, file in enumerate(files, 1):
+        print(f"{i}. {os.path.basename(file)}")
+
+    print(f"{len(files) + 1}. Use my own file (provide path)")
+
+    while True:
+        try:
+            choice = input("\nEnter your choice (number): ")
+            choice = int(choice.strip())
+
+            if 1 <= choice <= len(files):
+                return files[choice - 1]
+            elif choice == len(files) + 1:
+                while True:
+                    file_path = input("Enter the full path to your Excel file: ").strip()
+                    if is_excel_file(file_path):
+                        return file_path
+                    else:
+                        print("File not found or not an Excel file. Please try again.")
+            else:
+                print("Invalid choice. Please try again.")
+
+        except ValueError:
+            print("Please enter a number.")
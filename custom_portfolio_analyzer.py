@@ -6,8 +6,26 @@ Example of using the Portfolio Analyzer as a library in a custom application
 from portfolio_analyzer import PortfolioAnalyzer, Stock
 from typing import List
 import json
+import numpy as np
 from datetime import datetime
 
+def print_valuation_summary(stocks: List[Stock]):
+    """Print P&L and weight per holding, computed with vectorized numpy
+    arithmetic instead of per-stock Python loops"""
+    qty = np.fromiter((s.quantity for s in stocks), dtype=np.float64, count=len(stocks))
+    avg = np.fromiter((s.average_price for s in stocks), dtype=np.float64, count=len(stocks))
+    cur = np.fromiter((s.current_price for s in stocks), dtype=np.float64, count=len(stocks))
+
+    value = qty * cur
+    pnl = qty * (cur - avg)
+    total_value = value.sum()
+    weights = value * (100.0 / total_value) if total_value else np.zeros_like(value)
+
+    print("\nPortfolio Valuation:")
+    for stock, stock_value, stock_pnl, weight in zip(stocks, value, pnl, weights):
+        print(f"  {stock.ticker}: value {stock_value:,.2f}, P&L {stock_pnl:+,.2f}, weight {weight:.1f}%")
+    print(f"  Total value: {total_value:,.2f} (P&L {pnl.sum():+,.2f})")
+
 def analyze_custom_portfolio():
     """
     Example function showing how to use the portfolio analyzer 
@@ -52,9 +70,12 @@ def analyze_custom_portfolio():
         )
     ]
     
+    # Valuation math on the raw holdings, vectorized
+    print_valuation_summary(custom_portfolio)
+
     # Initialize the analyzer
     analyzer = PortfolioAnalyzer()
-    
+
     # Analyze the custom portfolio
     print(f"\nAnalyzing custom portfolio of {len(custom_portfolio)} stocks...")
     results = analyzer.analyze_portfolio(custom_portfolio)
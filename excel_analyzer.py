@@ -5,259 +5,440 @@ This script processes Excel files and outputs analysis results as Excel files
 """
 
 import os
+import shutil
 import sys
+import numpy as np
 import pandas as pd
 import argparse
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
-# Import the analyzers
-from mutual_fund_analyzer import MutualFundAnalyzer
-from portfolio_analyzer import PortfolioAnalyzer
+from analysis_cache import CACHE_DIR, file_digest, load_cached_analysis, save_cached_analysis
 
-def analyze_excel_file(input_file, output_file=None, analysis_type="auto", news_api_key=None):
+# Prefer xlsxwriter for output - it is much faster than openpyxl for
+# multi-sheet to_excel writes
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_WRITE_ENGINE = "xlsxwriter"
+except ImportError:
+    EXCEL_WRITE_ENGINE = "openpyxl"
+
+def _open_writer(output_file):
+    """Open a pandas ExcelWriter on the fastest available engine"""
+    if EXCEL_WRITE_ENGINE == "xlsxwriter":
+        # constant_memory flushes each row to disk as it is written, so
+        # peak memory stays flat however large the news sheets get. Safe
+        # here because every sheet is written top to bottom exactly once.
+        return pd.ExcelWriter(
+            output_file, engine="xlsxwriter",
+            engine_kwargs={"options": {"constant_memory": True,
+                                       "nan_inf_to_errors": True}})
+    # Plain openpyxl fallback: pandas writes cells by coordinate, which
+    # write_only worksheets do not support
+    return pd.ExcelWriter(output_file, engine="openpyxl")
+
+def detect_analysis_type(input_file):
+    """Infer the analysis type from the input filename"""
+    if "fund" in os.path.basename(input_file).lower():
+        return "mutual_fund"
+    return "portfolio"
+
+def existing_file(path):
+    """argparse type check so missing inputs fail before any analysis"""
+    if not os.path.exists(path):
+        raise argparse.ArgumentTypeError(f"Input file not found: {path}")
+    return path
+
+# Fixed integer codes for impact labels, used by the histogram pivot
+IMPACT_CODE = {"Positive": 0, "Negative": 1, "Neutral": 2}
+
+def _write_small_sheet(writer, sheet_name, headers, rows):
+    """Write a tiny sheet straight through the engine, skipping pandas.
+
+    Wrapping a handful of cells in a DataFrame just for to_excel pays for
+    BlockManager construction and dtype inference; for the one-row summary
+    sheets that dwarfs the actual write.
     """
-    Analyze an Excel file and output the results as an Excel file
-    
-    Args:
-        input_file: Path to the input Excel file
-        output_file: Path to the output Excel file (optional)
-        analysis_type: Type of analysis to perform ("portfolio", "mutual_fund", or "auto")
-        news_api_key: NewsAPI key for news analysis
-    
-    Returns:
-        Path to the output Excel file
+    if EXCEL_WRITE_ENGINE == "xlsxwriter":
+        worksheet = writer.book.add_worksheet(sheet_name)
+        writer.sheets[sheet_name] = worksheet
+        worksheet.write_row(0, 0, headers)
+        for i, row in enumerate(rows, 1):
+            worksheet.write_row(i, 0, row)
+    else:
+        worksheet = writer.book.create_sheet(sheet_name)
+        writer.sheets[sheet_name] = worksheet
+        worksheet.append(list(headers))
+        for row in rows:
+            worksheet.append(list(row))
+
+def _build_sector_frames(results):
+    """Build the Sector Impact sheet and its sector/impact pivot.
+
+    The pivot is a bincount histogram over integer label codes: sectors
+    are factorized once and impacts mapped to fixed int codes, so the
+    counting runs as a single C-level pass regardless of portfolio size.
+    """
+    get = attrgetter("stock", "ticker", "sector", "impact")
+    companies, tickers, sectors, impacts = zip(*map(get, results.stocks))
+    sector_impact_df = pd.DataFrame({
+        "Company": companies,
+        "Ticker": tickers,
+        "Sector": sectors,
+        "Impact": impacts
+    })
+    sector_impact_df["Sector"] = sector_impact_df["Sector"].fillna("Unknown")
+
+    sector_codes, unique_sectors = pd.factorize(sector_impact_df["Sector"])
+    impact_codes = np.fromiter((IMPACT_CODE.get(i, 2) for i in impacts),
+                               dtype=np.int64, count=len(impacts))
+    hist = np.bincount(sector_codes * 3 + impact_codes,
+                       minlength=len(unique_sectors) * 3).reshape(-1, 3)
+    totals = hist.sum(axis=1)
+    scale = np.zeros(len(totals))
+    np.divide(100.0, totals, out=scale, where=totals > 0)
+
+    pivot_df = pd.DataFrame(hist, columns=["Positive", "Negative", "Neutral"])
+    pivot_df.insert(0, "Sector", unique_sectors)
+    pivot_df["Total"] = totals
+    pivot_df[["Positive %", "Negative %", "Neutral %"]] = hist * scale[:, None]
+    return sector_impact_df, pivot_df
+
+def _build_stocks_frame(results):
+    """Build the Stock Analysis sheet"""
+    if results.stocks:
+        get = attrgetter("stock", "ticker", "sector", "impact", "news_summary")
+        companies, tickers, sectors, impacts, summaries = zip(*map(get, results.stocks))
+    else:
+        companies = tickers = sectors = impacts = summaries = ()
+    return pd.DataFrame({
+        "Company": companies,
+        "Ticker": tickers,
+        "Sector": sectors,
+        "Impact": impacts,
+        "News Summary": summaries
+    }).fillna({"Sector": "Unknown"})
+
+def _build_valuation_frames(results):
+    """Build the Portfolio Valuation sheet and its TOTAL summary row.
+
+    The per-stock arithmetic is vectorized over numpy arrays. Returns
+    (None, None) when no stock carries price data.
+    """
+    # getattr with a default is one C-level lookup per field; the previous
+    # hasattr chain paid for an exception-guarded probe plus a re-fetch
+    priced = [stock for stock in results.stocks
+              if getattr(stock, 'quantity', None) and getattr(stock, 'current_price', None)]
+
+    if not priced:
+        return None, None
+
+    n = len(priced)
+    qty = np.fromiter((s.quantity for s in priced), dtype=np.float64, count=n)
+    cp = np.fromiter((s.current_price for s in priced), dtype=np.float64, count=n)
+    ap = np.fromiter((s.average_price or 0 for s in priced), dtype=np.float64, count=n)
+
+    current_value = qty * cp
+    cost_value = qty * ap
+    profit_loss = np.where(ap > 0, current_value - cost_value, 0.0)
+    profit_loss_pct = np.zeros(n)
+    np.divide(profit_loss, cost_value, out=profit_loss_pct, where=cost_value > 0)
+    profit_loss_pct *= 100
+
+    total_value = current_value.sum()
+    total_cost = cost_value.sum()
+
+    valuation_df = pd.DataFrame({
+        "Company": [s.stock for s in priced],
+        "Ticker": [s.ticker for s in priced],
+        "Quantity": qty,
+        "Average Price": [s.average_price for s in priced],
+        "Current Price": cp,
+        "Current Value": current_value,
+        "Cost Value": cost_value,
+        "Profit/Loss": profit_loss,
+        "Profit/Loss %": profit_loss_pct
+    })
+
+    total_row = ["TOTAL", "", "", "", "",
+                 total_value, total_cost, total_value - total_cost,
+                 (total_value - total_cost) / total_cost * 100 if total_cost > 0 else 0]
+    return valuation_df, total_row
+
+def _build_news_frame(results):
+    """Build the Additional News sheet, or None when there is no news.
+
+    One small columnar frame per stock (the company name broadcasts as a
+    scalar) concatenated at the end - cheaper than accumulating thousands
+    of row dicts and re-inferring columns from them.
+    """
+    frames = []
+    for stock in results.stocks:
+        news = stock.additional_news
+        if not news:
+            continue
+        frames.append(pd.DataFrame({
+            "Company": stock.stock,
+            "Title": [n.title for n in news],
+            "Description": [n.description for n in news],
+            "Source": [n.source for n in news],
+            "Published At": [n.published_at for n in news],
+            "URL": [n.url for n in news]
+        }))
+    if not frames:
+        return None
+    return pd.concat(frames, ignore_index=True, copy=False)
+
+def _write_excel(output_file, results, analysis_type, compact=False, cache_file=None):
+    """Serialize analyzer results into the multi-sheet output workbook"""
+    if analysis_type == "mutual_fund":
+        # Create Excel output
+        with _open_writer(output_file) as writer:
+            # Summary sheet
+            _write_small_sheet(
+                writer, 'Summary',
+                ["Fund Name", "Analysis Date", "Holdings Count", "Overall Impact"],
+                [[results.fund_name, results.timestamp,
+                  results.holdings_count, results.llm_analysis.impact]])
+            
+            # Top Holdings sheet - columnar construction: one tuple per
+            # row via attrgetter instead of one dict per row
+            if results.top_holdings:
+                get = attrgetter("name", "ticker", "sector", "percentage")
+                names, tickers, sectors, pcts = zip(*map(get, results.top_holdings))
+            else:
+                names = tickers = sectors = pcts = ()
+            # Missing tickers/sectors are resolved with one vectorized
+            # fillna instead of a Python-level `or` per row
+            holdings_df = pd.DataFrame({
+                "Company": names,
+                "Ticker": tickers,
+                "Sector": sectors,
+                "% of Fund": pcts
+            }).fillna({"Ticker": "N/A", "Sector": "N/A"})
+            holdings_df.to_excel(writer, sheet_name='Top Holdings', index=False)
+
+            # Sector Exposure sheet
+            sector_df = pd.DataFrame({
+                "Sector": list(results.sector_exposure.keys()),
+                "Allocation (%)": list(results.sector_exposure.values())
+            })
+            sector_df.to_excel(writer, sheet_name='Sector Allocation', index=False)
+
+            # News Impact sheet
+            if results.stock_analyses:
+                get = attrgetter("stock", "ticker", "impact", "news_summary")
+                companies, tickers, impacts, summaries = zip(*map(get, results.stock_analyses))
+            else:
+                companies = tickers = impacts = summaries = ()
+            news_df = pd.DataFrame({
+                "Company": companies,
+                "Ticker": tickers,
+                "Impact": impacts,
+                "News Summary": summaries
+            })
+            news_df.to_excel(writer, sheet_name='News Impact', index=False)
+            
+            llm = results.llm_analysis
+            if compact:
+                # One AI Output sheet with a Section column instead of
+                # four small sheets, saving per-sheet setup cost
+                rows = ([("Summary", llm.summary), ("Impact", llm.impact)]
+                        + [("Recommendation", r) for r in llm.recommendations]
+                        + [("Risk", r) for r in llm.risks]
+                        + [("Opportunity", o) for o in llm.opportunities])
+                ai_df = pd.DataFrame(rows, columns=["Section", "Detail"])
+                ai_df.to_excel(writer, sheet_name='AI Output', index=False)
+            else:
+                # AI Analysis sheet
+                _write_small_sheet(writer, 'AI Analysis',
+                                   ["Summary", "Impact"],
+                                   [[llm.summary, llm.impact]])
+
+                # Recommendations, Risks, Opportunities
+                recommendations_df = pd.DataFrame({"Recommendations": llm.recommendations})
+                recommendations_df.to_excel(writer, sheet_name='Recommendations', index=False)
+
+                risks_df = pd.DataFrame({"Risks": llm.risks})
+                risks_df.to_excel(writer, sheet_name='Risks', index=False)
+
+                opportunities_df = pd.DataFrame({"Opportunities": llm.opportunities})
+                opportunities_df.to_excel(writer, sheet_name='Opportunities', index=False)
+
+    else:  # portfolio analysis
+        # Create Excel output. The heavier DataFrames are built on a
+        # small thread pool so their construction overlaps with the
+        # engine serializing the earlier sheets.
+        # With no analyzable stocks, every per-stock sheet would be an
+        # empty header block - skip building and writing them entirely
+        has_stocks = bool(results.stocks)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sector_future = pool.submit(_build_sector_frames, results) if has_stocks else None
+            stocks_future = pool.submit(_build_stocks_frame, results) if has_stocks else None
+            valuation_future = pool.submit(_build_valuation_frames, results) if has_stocks else None
+            news_future = pool.submit(_build_news_frame, results) if has_stocks else None
+
+            with _open_writer(output_file) as writer:
+                # Summary sheet
+                _write_small_sheet(writer, 'Summary',
+                                   ["Analysis Date", "Stocks Count"],
+                                   [[results.timestamp, len(results.stocks)]])
+
+                # Impact summary counted in a single pass
+                impact_counts = Counter(stock.impact for stock in results.stocks)
+                _write_small_sheet(
+                    writer, 'Impact Summary',
+                    ["Impact", "Count"],
+                    [[impact, impact_counts[impact]]
+                     for impact in ("Positive", "Negative", "Neutral")])
+
+                # Sector-based impact analysis plus its pivot
+                if sector_future is not None:
+                    sector_impact_df, pivot_df = sector_future.result()
+                    sector_impact_df.to_excel(writer, sheet_name='Sector Impact', index=False)
+                    pivot_df.to_excel(writer, sheet_name='Sector Analysis', index=False)
+
+                # Stocks analysis sheet
+                if stocks_future is not None:
+                    stocks_future.result().to_excel(writer, sheet_name='Stock Analysis', index=False)
+
+                # Portfolio valuation if price data is available
+                if valuation_future is not None:
+                    valuation_df, total_row = valuation_future.result()
+                    if valuation_df is not None:
+                        valuation_df.to_excel(writer, sheet_name='Portfolio Valuation', index=False)
+                        _write_small_sheet(writer, 'Portfolio Summary',
+                                           list(valuation_df.columns), [total_row])
+
+                # Additional news sheet
+                if news_future is not None:
+                    all_news_df = news_future.result()
+                    if all_news_df is not None:
+                        all_news_df.to_excel(writer, sheet_name='Additional News', index=False)
+
+    # Remember the workbook for identical future inputs
+    if cache_file:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        shutil.copyfile(output_file, cache_file)
+
+    print(f"Analysis complete! Results saved to {output_file}")
+    return output_file
+
+# Dedicated background thread for workbook serialization, so async callers
+# can overlap their own work with the Excel write
+_writer_pool = ThreadPoolExecutor(max_workers=1)
+
+def _completed(value):
+    """A Future that has already resolved to value"""
+    future = Future()
+    future.set_result(value)
+    return future
+
+def analyze_excel_file_async(input_file, output_file=None, analysis_type="auto", news_api_key=None,
+                             use_cache=True, compact=False):
+    """
+    Analyze an Excel file and serialize the workbook in the background
+
+    Takes the same arguments as analyze_excel_file but returns a Future
+    resolving to the output path (or None on failure), letting the caller
+    do other work while the Excel file is still being written.
     """
     # Set API key in environment variable if provided
     if news_api_key:
         os.environ["NEWS_API_KEY"] = news_api_key
-    
+
     # Determine analysis type if set to auto
     if analysis_type == "auto":
-        filename = os.path.basename(input_file).lower()
-        if "fund" in filename:
-            analysis_type = "mutual_fund"
-        else:
-            analysis_type = "portfolio"
-    
+        analysis_type = detect_analysis_type(input_file)
+
     # Set default output filename if not provided
     if not output_file:
         input_name = Path(input_file).stem
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"{input_name}_analysis_{timestamp}.xlsx"
-    
+
+    # An unchanged input file keyed by content hash means the previously
+    # generated workbook can be copied straight to the output path
+    cache_file = None
+    if use_cache:
+        try:
+            digest = file_digest(input_file)
+            layout = "_compact" if compact else ""
+            # The date bucket matches the analysis cache: workbooks built
+            # on yesterday's news are not served for today's runs
+            day = datetime.now().date().isoformat()
+            cache_file = os.path.join(CACHE_DIR, f"{digest}_{analysis_type}{layout}_{day}.xlsx")
+        except OSError:
+            cache_file = None
+
+        if cache_file and os.path.exists(cache_file):
+            shutil.copyfile(cache_file, output_file)
+            print(f"Analysis complete! Results saved to {output_file} (from cache)")
+            return _completed(output_file)
+
     print(f"Analyzing {input_file} as {analysis_type}...")
-    
+
     try:
         # Perform the analysis
         if analysis_type == "mutual_fund":
-            analyzer = MutualFundAnalyzer(news_api_key=os.getenv("NEWS_API_KEY"))
-            results = analyzer.analyze_from_excel(input_file)
-            
+            # Imported here so a portfolio run never pays for the mutual
+            # fund analyzer's import chain (and vice versa below)
+            from mutual_fund_analyzer import MutualFundAnalyzer, MutualFundAnalysis
+
+            # The analysis itself is also cached by content hash, so a new
+            # output layout for an unchanged input skips the news/LLM pipeline
+            results = load_cached_analysis(input_file, MutualFundAnalysis) if use_cache else None
+            if results is None:
+                analyzer = MutualFundAnalyzer(news_api_key=os.getenv("NEWS_API_KEY"))
+                results = analyzer.analyze_from_excel(input_file)
+                if use_cache:
+                    save_cached_analysis(input_file, results)
+
             # Generate visualizations
             viz_dir = "visualizations"
             os.makedirs(viz_dir, exist_ok=True)
             viz_paths = results.generate_visualizations(viz_dir)
-            
-            # Create Excel output
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                # Summary sheet
-                summary_data = {
-                    "Fund Name": [results.fund_name],
-                    "Analysis Date": [results.timestamp],
-                    "Holdings Count": [results.holdings_count],
-                    "Overall Impact": [results.llm_analysis.impact]
-                }
-                pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Top Holdings sheet
-                holdings_data = []
-                for holding in results.top_holdings:
-                    holdings_data.append({
-                        "Company": holding.name,
-                        "Ticker": holding.ticker or "N/A",
-                        "Sector": holding.sector or "N/A",
-                        "% of Fund": holding.percentage
-                    })
-                pd.DataFrame(holdings_data).to_excel(writer, sheet_name='Top Holdings', index=False)
-                
-                # Sector Exposure sheet
-                sector_data = []
-                for sector, percentage in results.sector_exposure.items():
-                    sector_data.append({
-                        "Sector": sector,
-                        "Allocation (%)": percentage
-                    })
-                pd.DataFrame(sector_data).to_excel(writer, sheet_name='Sector Allocation', index=False)
-                
-                # News Impact sheet
-                news_data = []
-                for analysis in results.stock_analyses:
-                    news_data.append({
-                        "Company": analysis.stock,
-                        "Ticker": analysis.ticker,
-                        "Impact": analysis.impact,
-                        "News Summary": analysis.news_summary
-                    })
-                pd.DataFrame(news_data).to_excel(writer, sheet_name='News Impact', index=False)
-                
-                # AI Analysis sheet
-                ai_data = {
-                    "Summary": [results.llm_analysis.summary],
-                    "Impact": [results.llm_analysis.impact]
-                }
-                ai_df = pd.DataFrame(ai_data)
-                ai_df.to_excel(writer, sheet_name='AI Analysis', index=False)
-                
-                # Recommendations, Risks, Opportunities
-                recommendations_df = pd.DataFrame({"Recommendations": results.llm_analysis.recommendations})
-                recommendations_df.to_excel(writer, sheet_name='Recommendations', index=False)
-                
-                risks_df = pd.DataFrame({"Risks": results.llm_analysis.risks})
-                risks_df.to_excel(writer, sheet_name='Risks', index=False)
-                
-                opportunities_df = pd.DataFrame({"Opportunities": results.llm_analysis.opportunities})
-                opportunities_df.to_excel(writer, sheet_name='Opportunities', index=False)
-            
+
         else:  # portfolio analysis
-            analyzer = PortfolioAnalyzer(api_key=os.getenv("NEWS_API_KEY"))
-            results = analyzer.analyze_from_excel(input_file)
-            
-            # Create Excel output
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                # Summary sheet
-                summary_data = {
-                    "Analysis Date": [results.timestamp],
-                    "Stocks Count": [len(results.stocks)]
-                }
-                pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Impact summary
-                impact_counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
-                for stock in results.stocks:
-                    impact_counts[stock.impact] += 1
-                
-                impact_df = pd.DataFrame({
-                    "Impact": list(impact_counts.keys()),
-                    "Count": list(impact_counts.values())
-                })
-                impact_df.to_excel(writer, sheet_name='Impact Summary', index=False)
-                
-                # Create a pivot table for sector-based impact analysis
-                sector_impact_data = []
-                sectors = set()
-                for stock in results.stocks:
-                    sectors.add(stock.sector or "Unknown")
-                    sector_impact_data.append({
-                        "Company": stock.stock,
-                        "Ticker": stock.ticker,
-                        "Sector": stock.sector or "Unknown",
-                        "Impact": stock.impact
-                    })
-                
-                if sector_impact_data:
-                    sector_impact_df = pd.DataFrame(sector_impact_data)
-                    sector_impact_df.to_excel(writer, sheet_name='Sector Impact', index=False)
-                    
-                    # Create a pivot table for sector analysis
-                    pivot_data = []
-                    for sector in sectors:
-                        sector_stocks = [s for s in results.stocks if (s.sector or "Unknown") == sector]
-                        pos = len([s for s in sector_stocks if s.impact == "Positive"])
-                        neg = len([s for s in sector_stocks if s.impact == "Negative"])
-                        neu = len([s for s in sector_stocks if s.impact == "Neutral"])
-                        total = len(sector_stocks)
-                        
-                        pivot_data.append({
-                            "Sector": sector,
-                            "Positive": pos,
-                            "Negative": neg,
-                            "Neutral": neu,
-                            "Total": total,
-                            "Positive %": (pos/total*100) if total > 0 else 0,
-                            "Negative %": (neg/total*100) if total > 0 else 0,
-                            "Neutral %": (neu/total*100) if total > 0 else 0
-                        })
-                    
-                    pd.DataFrame(pivot_data).to_excel(writer, sheet_name='Sector Analysis', index=False)
-                
-                # Stocks analysis sheet
-                stocks_data = []
-                for stock in results.stocks:
-                    stocks_data.append({
-                        "Company": stock.stock,
-                        "Ticker": stock.ticker,
-                        "Sector": stock.sector or "Unknown",
-                        "Impact": stock.impact,
-                        "News Summary": stock.news_summary
-                    })
-                pd.DataFrame(stocks_data).to_excel(writer, sheet_name='Stock Analysis', index=False)
-                
-                # Portfolio valuation if price data is available
-                valuation_data = []
-                total_value = 0
-                total_cost = 0
-                
-                for stock in results.stocks:
-                    if hasattr(stock, 'quantity') and stock.quantity and hasattr(stock, 'current_price') and stock.current_price:
-                        current_value = stock.quantity * stock.current_price
-                        cost_value = stock.quantity * (stock.average_price or 0)
-                        profit_loss = current_value - cost_value if stock.average_price else 0
-                        profit_loss_pct = (profit_loss / cost_value * 100) if cost_value > 0 else 0
-                        
-                        valuation_data.append({
-                            "Company": stock.stock,
-                            "Ticker": stock.ticker,
-                            "Quantity": stock.quantity,
-                            "Average Price": stock.average_price,
-                            "Current Price": stock.current_price,
-                            "Current Value": current_value,
-                            "Cost Value": cost_value,
-                            "Profit/Loss": profit_loss,
-                            "Profit/Loss %": profit_loss_pct
-                        })
-                        
-                        total_value += current_value
-                        total_cost += cost_value
-                
-                if valuation_data:
-                    valuation_df = pd.DataFrame(valuation_data)
-                    valuation_df.to_excel(writer, sheet_name='Portfolio Valuation', index=False)
-                    
-                    # Add summary row
-                    summary_row = pd.DataFrame({
-                        "Company": ["TOTAL"],
-                        "Ticker": [""],
-                        "Quantity": [""],
-                        "Average Price": [""],
-                        "Current Price": [""],
-                        "Current Value": [total_value],
-                        "Cost Value": [total_cost],
-                        "Profit/Loss": [total_value - total_cost],
-                        "Profit/Loss %": [(total_value - total_cost) / total_cost * 100 if total_cost > 0 else 0]
-                    })
-                    
-                    # Write the summary row to a separate sheet
-                    summary_row.to_excel(writer, sheet_name='Portfolio Summary', index=False)
-                
-                # Additional news sheet
-                all_news = []
-                for stock in results.stocks:
-                    for news in stock.additional_news:
-                        all_news.append({
-                            "Company": stock.stock,
-                            "Title": news.title,
-                            "Description": news.description,
-                            "Source": news.source,
-                            "Published At": news.published_at,
-                            "URL": news.url
-                        })
-                if all_news:
-                    pd.DataFrame(all_news).to_excel(writer, sheet_name='Additional News', index=False)
-        
-        print(f"Analysis complete! Results saved to {output_file}")
-        return output_file
-    
+            from portfolio_analyzer import PortfolioAnalyzer, PortfolioAnalysis
+
+            results = load_cached_analysis(input_file, PortfolioAnalysis) if use_cache else None
+            if results is None:
+                analyzer = PortfolioAnalyzer(api_key=os.getenv("NEWS_API_KEY"))
+                results = analyzer.analyze_from_excel(input_file)
+                if use_cache:
+                    save_cached_analysis(input_file, results)
+
+    except Exception as e:
+        print(f"Error during analysis: {str(e)}")
+        return _completed(None)
+
+    return _writer_pool.submit(_write_excel, output_file, results, analysis_type,
+                               compact, cache_file)
+
+def analyze_excel_file(input_file, output_file=None, analysis_type="auto", news_api_key=None,
+                       use_cache=True, compact=False):
+    """
+    Analyze an Excel file and output the results as an Excel file
+
+    Args:
+        input_file: Path to the input Excel file
+        output_file: Path to the output Excel file (optional)
+        analysis_type: Type of analysis to perform ("portfolio", "mutual_fund", or "auto")
+        news_api_key: NewsAPI key for news analysis
+        use_cache: Reuse a cached workbook when the input file is unchanged
+        compact: Merge the AI analysis sheets into a single AI Output sheet
+
+    Returns:
+        Path to the output Excel file
+    """
+    try:
+        return analyze_excel_file_async(input_file, output_file, analysis_type,
+                                        news_api_key, use_cache, compact).result()
     except Exception as e:
         print(f"Error during analysis: {str(e)}")
         return None
@@ -265,24 +446,26 @@ def analyze_excel_file(input_file, output_file=None, analysis_type="auto", news_
 def main():
     """Main function to run the Excel analyzer"""
     parser = argparse.ArgumentParser(description='Analyze portfolio or mutual fund Excel files')
-    parser.add_argument('input_file', help='Path to the input Excel file')
+    parser.add_argument('input_file', type=existing_file, help='Path to the input Excel file')
     parser.add_argument('--output', '-o', help='Path to the output Excel file')
     parser.add_argument('--type', '-t', choices=['portfolio', 'mutual_fund', 'auto'], 
                         default='auto', help='Type of analysis to perform')
     parser.add_argument('--api-key', '-k', help='NewsAPI key for news analysis')
-    
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-run the analysis even when a cached workbook exists')
+    parser.add_argument('--compact', action='store_true',
+                        help='Merge the AI analysis sheets into a single AI Output sheet')
+
     args = parser.parse_args()
-    
-    if not os.path.exists(args.input_file):
-        print(f"Error: Input file not found: {args.input_file}")
-        return 1
-    
+
     # Run the analysis
     output_file = analyze_excel_file(
-        args.input_file, 
-        args.output, 
-        args.type, 
-        args.api_key
+        args.input_file,
+        args.output,
+        args.type,
+        args.api_key,
+        use_cache=not args.no_cache,
+        compact=args.compact
     )
     
     if output_file:
@@ -5,21 +5,34 @@ This module analyzes mutual fund holdings to provide insight into fund compositi
 and news impact on the overall fund performance.
 """
 
+import functools
+import heapq
 import json
 import os
+import re
 import sys
 import requests
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from collections import Counter, defaultdict
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Dict, Optional, Any, Tuple
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 from requests_ratelimiter import LimiterSession
 from dotenv import load_dotenv
 
 # Import from existing portfolio analyzer
-from portfolio_analyzer import Stock, NewsItem, StockAnalysis, PortfolioAnalysis
+from portfolio_analyzer import Stock, NewsItem, StockAnalysis, PortfolioAnalysis, read_excel_readonly, dump_json
+
+# Optional polars fast path for Excel ingest (opt in with PORTFOLIO_FAST_IO=1);
+# polars parses through multithreaded calamine and hands the columns over
+# as zero-copy Arrow buffers instead of per-cell Python objects
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +41,38 @@ load_dotenv()
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 LLM_API_KEY = os.getenv("LLM_API_KEY", "xai-L9NtX3VBbiKDNisc12yssrysUYw3KZt4JFlKzfcmLeJyEWums01fMVPmw2LspuqQcq9I1iL42ITnthVq")
 
+# Common column names for mutual fund holdings
+COLUMN_MAPS = {
+    'name': ['Company Name', 'Security Name', 'Holding', 'Stock', 'Instrument', 'Security', 'Name', 'Issuer'],
+    'ticker': ['Ticker', 'Symbol', 'Tradingsymbol', 'Security Code', 'ISIN', 'Code'],
+    'percentage': ['% of Net Assets', 'Weight', '% Assets', 'Allocation', 'Percentage', '% of Fund', 'Weightage', 'Weight (%)'],
+    'sector': ['Sector', 'Industry', 'Asset Class', 'Category', 'Segment']
+}
+
+# Flattened once into a lowercase variation -> standard name lookup so
+# mapping a sheet's columns is one O(1) dict probe per column instead of
+# re-lowercasing every variation for every column
+COLUMN_LOOKUP = {variation.lower(): std_name
+                 for std_name, variations in COLUMN_MAPS.items()
+                 for variation in variations}
+
+# Integer codes for the news impact labels so tallies can run as a
+# bincount over an int8 array rather than dict updates per analysis
+IMPACT_CODES = {"Positive": 0, "Negative": 1, "Neutral": 2}
+
+# Region keyword matchers for the geographic-exposure classifier; one
+# precompiled alternation per region scans each holding in a single C-level
+# pass instead of a Python any() over every keyword (holdings matching
+# neither pattern are assumed domestic/Indian)
+US_PATTERN = re.compile('inc|corp|nyse|nasdaq')
+EU_PATTERN = re.compile('plc|sa|nv|ag')
+
+# Sector keyword groups for the cyclical/defensive/financial weighting,
+# lowercased once at module load instead of per comparison
+CYCLICAL_SECTORS = ("technology", "consumer discretionary", "industrials", "materials", "real estate")
+DEFENSIVE_SECTORS = ("healthcare", "consumer staples", "utilities", "telecommunications")
+FINANCIAL_SECTORS = ("banking", "financial services", "insurance")
+
 # Pydantic models for mutual fund data
 class FundHolding(BaseModel):
     """Model for a single holding in a mutual fund"""
@@ -35,6 +80,12 @@ class FundHolding(BaseModel):
     ticker: Optional[str] = None
     percentage: float
     sector: Optional[str] = None
+
+    @validator('sector')
+    def sector_stripped(cls, v):
+        # Original casing is kept for display ("FMCG", "IT Services");
+        # calculate_sector_exposure folds case when it aggregates
+        return v.strip() if isinstance(v, str) else v
     
 class MutualFund(BaseModel):
     """Model for a mutual fund"""
@@ -42,15 +93,48 @@ class MutualFund(BaseModel):
     holdings: List[FundHolding]
     sector_exposure: Dict[str, float] = Field(default_factory=dict)
     
+    def holdings_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Columnar (structure-of-arrays) view of the holdings.
+
+        Returns parallel (names, tickers, percentages, sectors) numpy
+        arrays so analytics like sector aggregation and top-N selection
+        run as whole-array operations instead of attribute access per
+        pydantic object. The FundHolding list stays as the serialization
+        shape for JSON output and the analysis cache.
+        """
+        count = len(self.holdings)
+        names = np.array([h.name for h in self.holdings], dtype=object)
+        tickers = np.array([h.ticker for h in self.holdings], dtype=object)
+        percentages = np.fromiter((h.percentage for h in self.holdings), dtype=np.float64, count=count)
+        sectors = np.array([h.sector for h in self.holdings], dtype=object)
+        return names, tickers, percentages, sectors
+
     def calculate_sector_exposure(self):
-        """Calculate sector exposure percentages"""
-        self.sector_exposure = {}
-        for holding in self.holdings:
-            if holding.sector:
-                if holding.sector in self.sector_exposure:
-                    self.sector_exposure[holding.sector] += holding.percentage
-                else:
-                    self.sector_exposure[holding.sector] = holding.percentage
+        """Calculate sector exposure percentages.
+
+        Sums weights per sector with numpy (np.unique integer ids plus a
+        np.bincount weighted sum) instead of a per-holding dict loop, which
+        scales much better on index funds with hundreds of holdings.
+        """
+        if not self.holdings:
+            self.sector_exposure = {}
+            return self.sector_exposure
+
+        _, _, weights, sectors = self.holdings_arrays()
+        tagged = np.array([bool(s) for s in sectors], dtype=bool)
+        if not tagged.any():
+            self.sector_exposure = {}
+            return self.sector_exposure
+
+        # Group case variants ("banking"/"BANKING") on a lowercased key
+        # but report the first-seen original casing - rewriting the names
+        # themselves would mangle acronym sectors like "FMCG"
+        sector_strs = sectors[tagged].astype(str)
+        unique_keys, first_seen, sector_ids = np.unique(
+            np.char.lower(sector_strs), return_index=True, return_inverse=True)
+        sums = np.bincount(sector_ids, weights=weights[tagged], minlength=len(unique_keys))
+
+        self.sector_exposure = dict(zip(sector_strs[first_seen].tolist(), sums.tolist()))
         return self.sector_exposure
 
 class LLMAnalysis(BaseModel):
@@ -70,67 +154,191 @@ class MutualFundAnalysis(BaseModel):
     sector_exposure: Dict[str, float]
     stock_analyses: List[StockAnalysis]
     llm_analysis: LLMAnalysis
+    # News impact tally, computed once during analysis and reused by the
+    # console summary and the visualizations
+    impact_counts: Dict[str, int] = Field(default_factory=dict)
     
     def to_json(self, filepath=None):
         """Convert the analysis to JSON"""
         data = self.model_dump(mode='json')
         if filepath:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            dump_json(data, filepath)
         return data
     
     def generate_visualizations(self, output_dir="."):
         """Generate visualizations for the mutual fund analysis"""
+        # Deferred import: matplotlib costs hundreds of milliseconds at
+        # startup and is only needed when charts are actually requested
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
-        
+
+        # One Agg-backed figure reused for all three charts; the OO API
+        # sidesteps pyplot's global figure manager and per-figure teardown
+        fig = Figure(figsize=(10, 8))
+        FigureCanvasAgg(fig)
+        prefix = self.fund_name.replace(' ', '_')
+
         # 1. Sector Exposure Pie Chart
-        plt.figure(figsize=(10, 8))
+        ax = fig.add_subplot(111)
         sectors = list(self.sector_exposure.keys())
         values = list(self.sector_exposure.values())
-        
-        plt.pie(values, labels=sectors, autopct='%1.1f%%')
-        plt.title(f'Sector Allocation for {self.fund_name}')
-        plt.tight_layout()
-        sector_pie_path = os.path.join(output_dir, f"{self.fund_name.replace(' ', '_')}_sector_pie.png")
-        plt.savefig(sector_pie_path)
-        plt.close()
-        
-        # 2. Top Holdings Bar Chart
-        plt.figure(figsize=(12, 8))
-        top_holdings_df = pd.DataFrame(
-            [(h.name, h.percentage) for h in self.top_holdings[:10]],
-            columns=['Company', 'Percentage']
-        )
-        
-        sns.barplot(data=top_holdings_df, x='Percentage', y='Company')
-        plt.title(f'Top 10 Holdings - {self.fund_name}')
-        plt.tight_layout()
-        holdings_bar_path = os.path.join(output_dir, f"{self.fund_name.replace(' ', '_')}_top_holdings.png")
-        plt.savefig(holdings_bar_path)
-        plt.close()
-        
-        # 3. News Impact Chart
-        impact_counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
-        for analysis in self.stock_analyses:
-            impact_counts[analysis.impact] += 1
-        
-        plt.figure(figsize=(10, 6))
+
+        ax.pie(values, labels=sectors, autopct='%1.1f%%')
+        ax.set_title(f'Sector Allocation for {self.fund_name}')
+        fig.tight_layout()
+        sector_pie_path = os.path.join(output_dir, f"{prefix}_sector_pie.png")
+        fig.savefig(sector_pie_path)
+        fig.clear()
+
+        # 2. Top Holdings Bar Chart - plain barh; seaborn's category
+        # inference and intermediate DataFrame are overhead for ten bars
+        fig.set_size_inches(12, 8)
+        ax = fig.add_subplot(111)
+        top10 = self.top_holdings[:10]
+
+        ax.barh([h.name for h in top10], [h.percentage for h in top10])
+        ax.invert_yaxis()  # largest holding at the top, as before
+        ax.set_xlabel('Percentage')
+        ax.set_title(f'Top 10 Holdings - {self.fund_name}')
+        fig.tight_layout()
+        holdings_bar_path = os.path.join(output_dir, f"{prefix}_top_holdings.png")
+        fig.savefig(holdings_bar_path)
+        fig.clear()
+
+        # 3. News Impact Chart (counts precomputed during analysis; fall
+        # back to a fresh tally for results loaded from older caches)
+        counts = self.impact_counts or Counter(a.impact for a in self.stock_analyses)
+        impact_counts = {k: counts.get(k, 0) for k in ("Positive", "Negative", "Neutral")}
+
+        fig.set_size_inches(10, 6)
+        ax = fig.add_subplot(111)
         colors = {'Positive': 'green', 'Neutral': 'gray', 'Negative': 'red'}
-        plt.bar(impact_counts.keys(), impact_counts.values(), color=[colors[k] for k in impact_counts.keys()])
-        plt.title(f'News Impact Distribution - {self.fund_name}')
-        plt.ylabel('Number of Holdings')
-        plt.tight_layout()
-        impact_bar_path = os.path.join(output_dir, f"{self.fund_name.replace(' ', '_')}_impact.png")
-        plt.savefig(impact_bar_path)
-        plt.close()
-        
+        ax.bar(impact_counts.keys(), impact_counts.values(), color=[colors[k] for k in impact_counts.keys()])
+        ax.set_title(f'News Impact Distribution - {self.fund_name}')
+        ax.set_ylabel('Number of Holdings')
+        fig.tight_layout()
+        impact_bar_path = os.path.join(output_dir, f"{prefix}_impact.png")
+        fig.savefig(impact_bar_path)
+
         return {
             "sector_pie": sector_pie_path,
             "holdings_bar": holdings_bar_path,
             "impact_bar": impact_bar_path
         }
 
+@functools.lru_cache(maxsize=32)
+def _extract_cached(filepath: str, mtime_ns: int, size: int, use_read_only: bool = True) -> MutualFund:
+    """Parse a fund workbook, memoized on the file's identity and
+    modification state so repeated runs over an unchanged file skip the
+    Excel engine entirely"""
+    # A sidecar with the parsed holdings is kept next to the workbook;
+    # when it is at least as new as the xlsx, later processes reload it
+    # and skip the Excel engine too
+    sidecar = filepath + '.holdings.json'
+    try:
+        if os.stat(sidecar).st_mtime_ns >= mtime_ns:
+            with open(sidecar) as f:
+                return MutualFund(**json.load(f))
+    except Exception:
+        # Missing, stale or corrupt sidecar - fall through to a fresh parse
+        pass
+
+    try:
+        # Read the Excel file (streaming read-only mode by default)
+        if POLARS_AVAILABLE and os.getenv("PORTFOLIO_FAST_IO") == "1":
+            df = pl.read_excel(filepath, engine='calamine').to_pandas(use_pyarrow_extension_array=True)
+        elif use_read_only:
+            df = read_excel_readonly(filepath)
+        else:
+            # Open the workbook once with an explicit engine rather than
+            # letting pd.read_excel re-detect and re-open it
+            xl = pd.ExcelFile(filepath, engine='openpyxl')
+            df = xl.parse(xl.sheet_names[0])
+        
+        # Try to identify the mutual fund name from the file
+        fund_name = os.path.basename(filepath).split('.')[0]
+        
+        # Create a mapping of existing columns to standard names in a
+        # single pass over the sheet's columns. Only the first column
+        # matching each standard name is renamed - a sheet carrying two
+        # aliases of the same field (say both "Symbol" and "ISIN") would
+        # otherwise end up with duplicate labels after the rename
+        column_mapping = {}
+        for col in df.columns:
+            std_name = COLUMN_LOOKUP.get(col.lower())
+            if std_name is not None and std_name not in column_mapping.values():
+                column_mapping[col] = std_name
+        
+        # Rename columns based on the mapping
+        if column_mapping:
+            df = df.rename(columns=column_mapping)
+        
+        # Ensure we have at least name and percentage
+        required_cols = ['name', 'percentage']
+        if not all(col in df.columns for col in required_cols):
+            # Try to infer missing columns
+            if 'percentage' not in df.columns:
+                # Look for a numeric column that might be percentage
+                for col in df.select_dtypes(include=['float64', 'float32', 'int64', 'int32']).columns:
+                    if df[col].max() <= 100:  # Likely a percentage column
+                        df = df.rename(columns={col: 'percentage'})
+                        break
+        
+        # Clean and convert data with whole-column operations; a
+        # per-row iterrows() loop here dominates runtime on large sheets
+        holdings = []
+        if 'name' in df.columns and 'percentage' in df.columns:
+            df = df[[c for c in ('name', 'ticker', 'percentage', 'sector') if c in df.columns]]
+
+            # Percentages arrive as numbers or strings like "4.25%";
+            # normalize the whole column in one pass
+            raw = df['percentage'].astype(str).str.strip()
+            pct = pd.to_numeric(raw.str.rstrip('%'), errors='coerce').to_numpy()
+            # Bare weights in the 0-1 range are fractions - scale them to
+            # 0-100 with a masked multiply on the raw float64 array. An
+            # explicit "%" suffix is already a percentage ("0.85%" means
+            # 0.85), so those entries are left alone
+            mask = (pct > 0) & (pct < 1) & ~raw.str.endswith('%').to_numpy()
+            pct[mask] *= 100
+
+            # Drop rows without a name or a usable percentage, and map
+            # missing tickers/sectors to None for the optional fields
+            df = df.assign(percentage=pct).dropna(subset=['name', 'percentage'])
+            # Strip sectors here as well: model_construct below bypasses
+            # the FundHolding validator
+            if 'sector' in df.columns:
+                # Cast back to object so the None fill below applies -
+                # on a StringDtype column, where() would leave pd.NA
+                df['sector'] = df['sector'].astype('string').str.strip().astype(object)
+            df = df.where(pd.notna(df), None)
+
+            # The columns are already cleaned, so model_construct skips
+            # pydantic's per-field validation on every row
+            holdings = [FundHolding.model_construct(**row) for row in df.to_dict('records')]
+        
+        # Holdings keep their sheet order; the places that report leaders
+        # select them with a bounded heapq.nlargest instead of a full sort
+
+        # Create the mutual fund
+        mutual_fund = MutualFund(name=fund_name, holdings=holdings)
+        mutual_fund.calculate_sector_exposure()
+
+        # Persist the parsed fund for fast reloads in later processes
+        try:
+            dump_json(mutual_fund.model_dump(mode='json'), sidecar)
+        except OSError:
+            pass  # e.g. read-only directory - the parse itself still succeeded
+
+        return mutual_fund
+    
+    except Exception as e:
+        print(f"Error extracting mutual fund data: {str(e)}")
+        # Return empty mutual fund
+        return MutualFund(name="Unknown Fund", holdings=[])
+
 class MutualFundAnalyzer:
     """
     Analyzer for mutual fund holdings and their impact
@@ -140,104 +348,45 @@ class MutualFundAnalyzer:
         """Initialize the analyzer with API keys"""
         self.news_api_key = news_api_key or NEWS_API_KEY
         self.llm_api_key = llm_api_key or LLM_API_KEY
-        
-        # Create rate-limited session for API calls
-        self.session = LimiterSession(per_second=1)
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.llm_api_key}"
-        })
-        
+        self._session = None
+
         # Import PortfolioAnalyzer for news analysis
         from portfolio_analyzer import PortfolioAnalyzer
         self.portfolio_analyzer = PortfolioAnalyzer(api_key=self.news_api_key)
+
+    @property
+    def session(self):
+        """Rate-limited session for LLM API calls, created on first use.
+
+        The fallback analysis path never touches it, so most runs skip
+        the limiter state and connection pool entirely; the ceiling
+        allows a few overlapping in-flight requests without breaching
+        API limits.
+        """
+        if self._session is None:
+            self._session = LimiterSession(per_second=5)
+            self._session.headers.update({
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.llm_api_key}"
+            })
+        return self._session
     
-    def extract_mutual_fund_from_excel(self, filepath: str) -> MutualFund:
+    def extract_mutual_fund_from_excel(self, filepath: str, use_read_only: bool = True) -> MutualFund:
         """
         Extract mutual fund data from an Excel file
         Handles various formats of mutual fund disclosures
         """
         try:
-            # Read the Excel file
-            df = pd.read_excel(filepath)
-            
-            # Try to identify the mutual fund name from the file
-            fund_name = os.path.basename(filepath).split('.')[0]
-            
-            # Common column names for mutual fund holdings
-            column_maps = {
-                'name': ['Company Name', 'Security Name', 'Holding', 'Stock', 'Instrument', 'Security', 'Name', 'Issuer'],
-                'ticker': ['Ticker', 'Symbol', 'Tradingsymbol', 'Security Code', 'ISIN', 'Code'],
-                'percentage': ['% of Net Assets', 'Weight', '% Assets', 'Allocation', 'Percentage', '% of Fund', 'Weightage', 'Weight (%)'],
-                'sector': ['Sector', 'Industry', 'Asset Class', 'Category', 'Segment']
-            }
-            
-            # Create a mapping of existing columns to standard names
-            column_mapping = {}
-            for std_name, variations in column_maps.items():
-                for col in df.columns:
-                    if col in variations or any(var.lower() == col.lower() for var in variations):
-                        column_mapping[col] = std_name
-                        break
-            
-            # Rename columns based on the mapping
-            if column_mapping:
-                df = df.rename(columns=column_mapping)
-            
-            # Ensure we have at least name and percentage
-            required_cols = ['name', 'percentage']
-            if not all(col in df.columns for col in required_cols):
-                # Try to infer missing columns
-                if 'percentage' not in df.columns:
-                    # Look for a numeric column that might be percentage
-                    for col in df.select_dtypes(include=['float64', 'float32', 'int64', 'int32']).columns:
-                        if df[col].max() <= 100:  # Likely a percentage column
-                            df = df.rename(columns={col: 'percentage'})
-                            break
-            
-            # Clean and convert data
-            # Process the dataframe to extract holdings
-            holdings = []
-            for _, row in df.iterrows():
-                holding_data = {}
-                
-                # Extract available fields
-                for field in ['name', 'ticker', 'percentage', 'sector']:
-                    if field in df.columns:
-                        holding_data[field] = row[field]
-                
-                # Only include rows with name and percentage
-                if 'name' in holding_data and 'percentage' in holding_data:
-                    # Handle percentage format (might be 0-100 or 0-1)
-                    pct = holding_data['percentage']
-                    if isinstance(pct, (int, float)):
-                        if pct > 0 and pct < 1:  # If percentage is in 0-1 range, convert to 0-100
-                            pct *= 100
-                        holding_data['percentage'] = pct
-                    else:
-                        try:
-                            # Try to convert string percentage to float
-                            pct = float(pct.strip('%'))
-                            holding_data['percentage'] = pct
-                        except (ValueError, AttributeError):
-                            continue  # Skip if percentage can't be converted
-                    
-                    holdings.append(FundHolding(**holding_data))
-            
-            # Sort holdings by percentage (descending)
-            holdings.sort(key=lambda x: x.percentage, reverse=True)
-            
-            # Create the mutual fund
-            mutual_fund = MutualFund(name=fund_name, holdings=holdings)
-            mutual_fund.calculate_sector_exposure()
-            
-            return mutual_fund
-        
-        except Exception as e:
+            stat = os.stat(filepath)
+        except OSError as e:
             print(f"Error extracting mutual fund data: {str(e)}")
-            # Return empty mutual fund
             return MutualFund(name="Unknown Fund", holdings=[])
-            
+
+        fund = _extract_cached(filepath, stat.st_mtime_ns, stat.st_size, use_read_only)
+        # Hand out a deep copy so callers can sort or mutate holdings
+        # without corrupting the cached parse
+        return fund.model_copy(deep=True)
+
     def convert_holdings_to_stocks(self, fund: MutualFund) -> List[Stock]:
         """Convert fund holdings to stock objects for news analysis"""
         stocks = []
@@ -251,30 +400,44 @@ class MutualFundAnalyzer:
             stocks.append(stock)
         return stocks
     
-    def get_llm_analysis(self, fund: MutualFund, stock_analyses: List[StockAnalysis]) -> LLMAnalysis:
+    def get_llm_analysis(self, fund: MutualFund, stock_analyses: List[StockAnalysis],
+                         impact_counts: Optional[Dict[str, int]] = None,
+                         top_holdings: Optional[List[FundHolding]] = None) -> LLMAnalysis:
         """
         Use LLM to perform comprehensive analysis of the mutual fund with focus on long-term outlook
         """
         try:
+            # Largest holdings, selected with a bounded heap when the
+            # caller has not already computed them
+            if top_holdings is None:
+                top_holdings = heapq.nlargest(15, fund.holdings, key=attrgetter('percentage'))
+
             # Prepare data for LLM
             # Create summary of fund holdings
             holdings_summary = []
-            for i, holding in enumerate(fund.holdings[:15], 1):  # Limit to top 15
+            for i, holding in enumerate(top_holdings[:15], 1):  # Limit to top 15
                 holdings_summary.append(
                     f"{i}. {holding.name} ({holding.ticker or 'N/A'}): {holding.percentage:.2f}% of fund"
                 )
             
+            # Rank sectors once; the summary, concentration stats, risks
+            # and opportunities below all reuse these
+            top_sectors = sorted(fund.sector_exposure.items(), key=lambda x: x[1], reverse=True)
+            primary_sectors = [s for s, _ in top_sectors[:3]]
+            sector_str = ' '.join(primary_sectors).lower()
+
             # Create summary of sector exposure
             sector_summary = []
-            for sector, percentage in sorted(fund.sector_exposure.items(), key=lambda x: x[1], reverse=True):
+            for sector, percentage in top_sectors:
                 sector_summary.append(f"{sector}: {percentage:.2f}%")
             
-            # Create summary of news analysis
+            # Create summary of news analysis (the impact tally is passed in
+            # by analyze_mutual_fund so it is only computed once)
+            if impact_counts is None:
+                impact_counts = Counter(a.impact for a in stock_analyses)
+
             news_summary = []
-            impact_counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
-            
             for analysis in stock_analyses[:15]:  # Limit to top 15
-                impact_counts[analysis.impact] += 1
                 news_summary.append(
                     f"{analysis.stock} ({analysis.ticker}): {analysis.impact} - {analysis.news_summary}"
                 )
@@ -294,53 +457,48 @@ class MutualFundAnalyzer:
                 overall_impact = "Neutral"
             
             # Generate a more comprehensive summary with long-term focus
-            # Get top sectors and their exposure
-            top_sectors = sorted(fund.sector_exposure.items(), key=lambda x: x[1], reverse=True)
             top_sector = top_sectors[0][0] if top_sectors else "unknown"
             sector_concentration = sum(1 for _, pct in top_sectors if pct > 10)
             
             # Analyze geographical distribution (assume names contain country indicators)
             foreign_exposure = []
-            india_keywords = ['india', 'indian', 'nse', 'bse', 'ltd', 'limited']
-            us_keywords = ['inc', 'corp', 'nyse', 'nasdaq']
-            eu_keywords = ['plc', 'sa', 'nv', 'ag']
-            
             for holding in fund.holdings:
-                name_lower = holding.name.lower()
-                ticker_lower = (holding.ticker or "").lower()
-                
-                if any(kw in ticker_lower or kw in name_lower for kw in us_keywords):
+                text = f"{holding.name} {holding.ticker or ''}".lower()
+
+                if US_PATTERN.search(text):
                     foreign_exposure.append(("US", holding))
-                elif any(kw in ticker_lower or kw in name_lower for kw in eu_keywords):
+                elif EU_PATTERN.search(text):
                     foreign_exposure.append(("EU", holding))
                 # Assume other holdings are domestic (Indian) by default
             
             # Determine fund characteristics with long-term perspective
             is_diversified = len(fund.sector_exposure) > 5
             is_concentrated = sector_concentration >= 2
-            top_holding_weight = fund.holdings[0].percentage if fund.holdings else 0
+            top_holding_weight = top_holdings[0].percentage if top_holdings else 0
             is_top_heavy = top_holding_weight > 10
             foreign_weight = sum(holding.percentage for _, holding in foreign_exposure)
             
-            # Analyze cyclical vs. defensive sectors
-            cyclical_sectors = ["Technology", "Consumer Discretionary", "Industrials", "Materials", "Real Estate"]
-            defensive_sectors = ["Healthcare", "Consumer Staples", "Utilities", "Telecommunications"]
-            financial_sectors = ["Banking", "Financial Services", "Insurance"]
-            
-            cyclical_weight = sum(pct for sector, pct in fund.sector_exposure.items() 
-                                if any(s.lower() in sector.lower() for s in cyclical_sectors))
-            defensive_weight = sum(pct for sector, pct in fund.sector_exposure.items() 
-                                 if any(s.lower() in sector.lower() for s in defensive_sectors))
-            financial_weight = sum(pct for sector, pct in fund.sector_exposure.items() 
-                                 if any(s.lower() in sector.lower() for s in financial_sectors))
+            # Analyze cyclical vs. defensive sectors in a single pass over
+            # the exposure dict, lowering each sector name only once; a
+            # sector can still count toward more than one group, as before
+            cyclical_weight = defensive_weight = financial_weight = 0.0
+            for sector, pct in fund.sector_exposure.items():
+                sector_lower = sector.lower()
+                if any(s in sector_lower for s in CYCLICAL_SECTORS):
+                    cyclical_weight += pct
+                if any(s in sector_lower for s in DEFENSIVE_SECTORS):
+                    defensive_weight += pct
+                if any(s in sector_lower for s in FINANCIAL_SECTORS):
+                    financial_weight += pct
             
             # Analyze market trends based on holdings news and sector allocation
-            sector_impact = {}
+            # One dict maps stock names to sectors, replacing a linear scan
+            # of the holdings per analysis
+            name_to_sector = {h.name: h.sector for h in fund.holdings}
+            sector_impact = defaultdict(lambda: {"Positive": 0, "Negative": 0, "Neutral": 0})
             for analysis in stock_analyses:
-                sector = next((h.sector for h in fund.holdings if h.name == analysis.stock), None)
+                sector = name_to_sector.get(analysis.stock)
                 if sector:
-                    if sector not in sector_impact:
-                        sector_impact[sector] = {"Positive": 0, "Negative": 0, "Neutral": 0}
                     sector_impact[sector][analysis.impact] += 1
             
             # Identify growth sectors and challenged sectors (longer-term outlook)
@@ -423,7 +581,7 @@ class MutualFundAnalyzer:
             
             # Single company exposure
             if is_top_heavy:
-                top_holding = fund.holdings[0].name
+                top_holding = top_holdings[0].name
                 risks.append(f"Extended company-specific exposure risk with {top_holding} representing {top_holding_weight:.1f}% of assets")
             
             # Cyclical vs defensive positioning risks
@@ -441,8 +599,6 @@ class MutualFundAnalyzer:
                 risks.append("Extended exposure to monetary policy and regulatory changes through significant financial sector allocation")
             
             # Factor in sector-specific structural risks
-            primary_sectors = [s[0] for s in top_sectors[:3]]
-            
             if any("Banking" in s or "Financial" in s for s in primary_sectors):
                 risks.append("Long-term exposure to interest rate cycles and regulatory environment changes through financial holdings")
             
@@ -464,9 +620,6 @@ class MutualFundAnalyzer:
                     opportunities.append(f"Structural growth potential in {sector} sector driven by sustained demand and innovation")
             
             # Economic evolution opportunities
-            primary_sectors = [s[0] for s in top_sectors[:3]]
-            sector_str = ' '.join(primary_sectors).lower()
-            
             if any("Banking" in s or "Financial" in s for s in primary_sectors):
                 opportunities.append("Fintech integration and digital banking transformation driving long-term value creation in financial holdings")
             
@@ -510,40 +663,81 @@ class MutualFundAnalyzer:
                 opportunities=["Unable to assess long-term opportunities due to analysis error"]
             )
     
-    def analyze_mutual_fund(self, fund: MutualFund) -> MutualFundAnalysis:
-        """
-        Analyze a mutual fund and provide comprehensive insights
-        """
-        # Convert fund holdings to stocks for news analysis
-        stocks = self.convert_holdings_to_stocks(fund)
-        
-        # Get news and analyze impact for each stock
-        print(f"Analyzing news for {len(stocks)} holdings in {fund.name}...")
-        stock_analyses = self.portfolio_analyzer.analyze_portfolio(stocks).stocks
-        
+    def _build_analysis(self, fund: MutualFund, stock_analyses: List[StockAnalysis]) -> MutualFundAnalysis:
+        """Assemble a MutualFundAnalysis from already-fetched news analyses"""
+        # Tally news impacts once as a bincount over int8 codes; the LLM
+        # analysis, console summary and visualizations all reuse this
+        codes = np.fromiter((IMPACT_CODES.get(a.impact, IMPACT_CODES["Neutral"]) for a in stock_analyses),
+                            dtype=np.int8, count=len(stock_analyses))
+        counts = np.bincount(codes, minlength=len(IMPACT_CODES))
+        impact_counts = {impact: int(counts[code]) for impact, code in IMPACT_CODES.items()}
+
+        # Largest holdings via a bounded heap - O(n log k) instead of
+        # sorting every holding when only the leaders are reported
+        top_holdings = heapq.nlargest(15, fund.holdings, key=attrgetter('percentage'))
+
         # Get LLM analysis
         print("Performing advanced impact analysis with LLM...")
-        llm_analysis = self.get_llm_analysis(fund, stock_analyses)
-        
+        llm_analysis = self.get_llm_analysis(fund, stock_analyses, impact_counts, top_holdings)
+
         # Create mutual fund analysis
-        analysis = MutualFundAnalysis(
+        return MutualFundAnalysis(
             fund_name=fund.name,
             timestamp=datetime.now().isoformat(),
             holdings_count=len(fund.holdings),
-            top_holdings=fund.holdings[:10],  # Top 10 holdings
+            top_holdings=top_holdings[:10],  # Top 10 holdings
             sector_exposure=fund.sector_exposure,
             stock_analyses=stock_analyses,
-            llm_analysis=llm_analysis
+            llm_analysis=llm_analysis,
+            impact_counts=dict(impact_counts)
         )
-        
-        return analysis
+
+    def analyze_mutual_fund(self, fund: MutualFund) -> MutualFundAnalysis:
+        """
+        Analyze a mutual fund and provide comprehensive insights
+        """
+        # Convert fund holdings to stocks for news analysis
+        stocks = self.convert_holdings_to_stocks(fund)
+
+        # Get news and analyze impact for each stock
+        print(f"Analyzing news for {len(stocks)} holdings in {fund.name}...")
+        stock_analyses = self.portfolio_analyzer.analyze_portfolio(stocks).stocks
+
+        return self._build_analysis(fund, stock_analyses)
+
+    def batch_analyze(self, funds: List[MutualFund]) -> List[MutualFundAnalysis]:
+        """
+        Analyze several funds in one pass, fetching news once per unique
+        holding across the whole batch
+
+        Funds overlap heavily (index constituents recur), so the
+        network-bound stage is deduplicated: each distinct stock is
+        analyzed a single time and the per-fund analyses are assembled
+        from that shared pool
+        """
+        if not funds:
+            return []
+
+        # Collect each distinct stock across every fund once
+        unique_stocks = {}
+        for fund in funds:
+            for stock in self.convert_holdings_to_stocks(fund):
+                unique_stocks.setdefault(stock.name, stock)
+
+        stocks = list(unique_stocks.values())
+        print(f"Analyzing news for {len(stocks)} unique holdings across {len(funds)} funds...")
+        by_name = {a.stock: a for a in self.portfolio_analyzer.analyze_portfolio(stocks).stocks}
+
+        return [self._build_analysis(fund,
+                                     [by_name[h.name] for h in fund.holdings if h.name in by_name])
+                for fund in funds]
     
-    def analyze_from_excel(self, excel_path: str) -> MutualFundAnalysis:
+    def analyze_from_excel(self, excel_path: str, use_read_only: bool = True) -> MutualFundAnalysis:
         """
         Read mutual fund from Excel and analyze it
         """
         # Extract mutual fund data
-        fund = self.extract_mutual_fund_from_excel(excel_path)
+        fund = self.extract_mutual_fund_from_excel(excel_path, use_read_only=use_read_only)
         
         if not fund.holdings:
             print(f"No valid holdings found in {excel_path}")
@@ -624,14 +818,10 @@ def main():
         for sector, pct in sorted(results.sector_exposure.items(), key=lambda x: x[1], reverse=True)[:5]:
             print(f"{sector}: {pct:.2f}%")
         
-        # News impact summary
-        impact_counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
-        for analysis in results.stock_analyses:
-            impact_counts[analysis.impact] += 1
-        
+        # News impact summary (tallied once during analysis)
         print("\nNews Impact Summary:")
-        for impact, count in impact_counts.items():
-            print(f"{impact}: {count} holdings")
+        for impact in ("Positive", "Negative", "Neutral"):
+            print(f"{impact}: {results.impact_counts.get(impact, 0)} holdings")
         
         # LLM Analysis
         print("\nAI Analysis:")
@@ -10,14 +10,95 @@ import json
 import time
 import random
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from pydantic import BaseModel
+from dataclasses import dataclass, asdict
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Model to store news data consistently across sources
-class NewsItem(BaseModel):
+# CSS selectors compiled once via soupsieve (the engine behind
+# soup.select) instead of being re-parsed for every page
+import soupsieve as sv
+
+_YAHOO_CARD_SEL = sv.compile('div[data-test="CARD"] h3')
+_MW_ARTICLE_SEL = sv.compile('.article__content')
+_MW_TITLE_SEL = sv.compile('.article__headline')
+_MW_LINK_SEL = sv.compile('a.link')
+_GF_ARTICLE_SEL = sv.compile('div.yY3Lee')
+_GF_TITLE_SEL = sv.compile('.Yfwt5')
+_GF_SOURCE_SEL = sv.compile('.sfyJob')
+
+def _select_one(compiled, tag):
+    """select_one against a precompiled soupsieve selector"""
+    matches = compiled.select(tag, 1)
+    return matches[0] if matches else None
+
+# lxml parses the scraped pages several times faster than the stdlib
+# backend; fall back to html.parser when it is not installed
+try:
+    import lxml  # noqa: F401
+    BS_PARSER = "lxml"
+except ImportError:
+    BS_PARSER = "html.parser"
+
+# On-disk TTL cache so repeat runs in the same research session reuse
+# fetched news and quotes instead of re-scraping every source
+NEWS_CACHE_DIR = os.path.join("cache", "news")
+NEWS_TTL = 7 * 86400      # news lists stay useful for about a week
+MARKET_DATA_TTL = 300     # quotes go stale in minutes
+
+def _cache_path(ticker: str, source: str) -> str:
+    """Cache file path for a (ticker, source) pair"""
+    safe_ticker = re.sub(r'\W+', '_', ticker)
+    return os.path.join(NEWS_CACHE_DIR, f"{safe_ticker}_{source}.json")
+
+def _cache_load(ticker: str, source: str, ttl: int):
+    """Return the cached payload for (ticker, source), or None when the
+    entry is missing, corrupt, or older than ttl seconds"""
+    path = _cache_path(ticker, source)
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+        if time.time() - entry["timestamp"] > ttl:
+            os.remove(path)
+            return None
+        return entry["payload"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _cache_store(ticker: str, source: str, payload) -> None:
+    """Persist a payload for (ticker, source); failures are non-fatal"""
+    try:
+        os.makedirs(NEWS_CACHE_DIR, exist_ok=True)
+        with open(_cache_path(ticker, source), "w") as f:
+            json.dump({"timestamp": time.time(), "payload": payload}, f)
+    except OSError:
+        pass
+
+# Sentiment vocabularies hoisted to module level and compiled once -
+# the word-boundary alternations replace per-title substring scans of
+# each word (and stop "top" matching inside "stopped")
+POSITIVE_WORDS = [
+    "up", "rise", "gain", "profit", "growth", "positive", "surge",
+    "increase", "higher", "rally", "bullish", "outperform", "beat",
+    "exceed", "upgrade", "strong", "top", "soar", "jump"
+]
+
+NEGATIVE_WORDS = [
+    "down", "fall", "drop", "loss", "decline", "negative", "plunge",
+    "decrease", "lower", "slip", "bearish", "underperform", "miss",
+    "downgrade", "weak", "bottom", "sink", "crash"
+]
+
+_POS_RE = re.compile(r"\b(" + "|".join(map(re.escape, POSITIVE_WORDS)) + r")\b")
+_NEG_RE = re.compile(r"\b(" + "|".join(map(re.escape, NEGATIVE_WORDS)) + r")\b")
+
+# Model to store news data consistently across sources - a slotted
+# dataclass, since these items are plain carriers between the fetchers
+# and the analyzer and never need pydantic validation
+@dataclass(slots=True)
+class NewsItem:
     title: str
     description: Optional[str] = None
     source: Optional[str] = None
@@ -39,6 +120,30 @@ class MultiFetchNewsProvider:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0"
         ]
         
+        # Shared session: pooled TCP+TLS connections are reused across
+        # sources and across holdings instead of paying a fresh handshake
+        # per request, with bounded retries for transient upstream errors
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Pin one user agent per source for the provider's lifetime -
+        # rotating per fetch defeats server-side session reuse and looks
+        # more bot-like to the scraped sites, not less
+        self._source_ua = {
+            "yahoo": random.choice(self.user_agents),
+            "marketwatch": random.choice(self.user_agents),
+            "google": random.choice(self.user_agents),
+            "market_data": random.choice(self.user_agents),
+        }
+        self.session.headers.update({"User-Agent": self._source_ua["market_data"]})
+
         # Define sources to fetch from - we'll add more as needed
         self.news_sources = [
             self._get_news_api,    # If API key is available
@@ -46,6 +151,13 @@ class MultiFetchNewsProvider:
             self._get_market_watch,
             self._get_google_finance
         ]
+
+        # One worker pool for the provider's lifetime - spawning four
+        # threads per get_company_news call costs more than the fetches
+        # overlap for short requests. Sized for the analyzer's fan-out:
+        # up to 10 stocks look up news concurrently, and each submits
+        # every source
+        self._fetch_pool = ThreadPoolExecutor(max_workers=len(self.news_sources) * 10)
     
     def _get_random_user_agent(self):
         """Get a random user agent to avoid blocking"""
@@ -68,7 +180,7 @@ class MultiFetchNewsProvider:
         }
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=(3.05, 10))
             if response.status_code != 200:
                 return []
             
@@ -98,19 +210,20 @@ class MultiFetchNewsProvider:
 
     def _get_yahoo_finance(self, ticker: str, company_name: str) -> List[NewsItem]:
         """Get news from Yahoo Finance"""
-        headers = {"User-Agent": self._get_random_user_agent()}
+        headers = {"User-Agent": self._source_ua["yahoo"]}
         url = f"https://finance.yahoo.com/quote/{ticker}/news"
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=(3.05, 10))
             if response.status_code != 200:
                 return []
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, BS_PARSER)
             news_items = []
             
+            now_iso = datetime.now().isoformat()
             # Extract news items from Yahoo Finance
-            articles = soup.select('div[data-test="CARD"] h3')
+            articles = _YAHOO_CARD_SEL.select(soup)
             for article in articles[:5]:  # Limit to top 5
                 title = article.text.strip()
                 link_tag = article.find_parent('a')
@@ -121,7 +234,7 @@ class MultiFetchNewsProvider:
                     description="",  # Yahoo doesn't show description in list view
                     source="Yahoo Finance",
                     url=link,
-                    published_at=datetime.now().isoformat()
+                    published_at=now_iso
                 ))
             
             return news_items
@@ -131,24 +244,25 @@ class MultiFetchNewsProvider:
 
     def _get_market_watch(self, ticker: str, company_name: str) -> List[NewsItem]:
         """Get news from MarketWatch"""
-        headers = {"User-Agent": self._get_random_user_agent()}
+        headers = {"User-Agent": self._source_ua["marketwatch"]}
         url = f"https://www.marketwatch.com/investing/stock/{ticker.lower()}"
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=(3.05, 10))
             if response.status_code != 200:
                 return []
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, BS_PARSER)
             news_items = []
             
+            now_iso = datetime.now().isoformat()
             # Extract news items from MarketWatch
-            articles = soup.select('.article__content')
+            articles = _MW_ARTICLE_SEL.select(soup)
             for article in articles[:5]:  # Limit to top 5
-                title_tag = article.select_one('.article__headline')
+                title_tag = _select_one(_MW_TITLE_SEL, article)
                 title = title_tag.text.strip() if title_tag else ""
                 
-                link_tag = article.select_one('a.link')
+                link_tag = _select_one(_MW_LINK_SEL, article)
                 link = link_tag['href'] if link_tag and 'href' in link_tag.attrs else None
                 
                 if title:
@@ -157,7 +271,7 @@ class MultiFetchNewsProvider:
                         description="",
                         source="MarketWatch",
                         url=link,
-                        published_at=datetime.now().isoformat()
+                        published_at=now_iso
                     ))
             
             return news_items
@@ -167,31 +281,32 @@ class MultiFetchNewsProvider:
 
     def _get_google_finance(self, ticker: str, company_name: str) -> List[NewsItem]:
         """Get news from Google Finance"""
-        headers = {"User-Agent": self._get_random_user_agent()}
+        headers = {"User-Agent": self._source_ua["google"]}
         
         # Try to handle different ticker formats
         encoded_ticker = ticker.replace('&', '%26')
         url = f"https://www.google.com/finance/quote/{encoded_ticker}:NSE"
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=(3.05, 10))
             if response.status_code != 200:
                 # Try US market
                 url = f"https://www.google.com/finance/quote/{encoded_ticker}:NASDAQ"
-                response = requests.get(url, headers=headers)
+                response = self.session.get(url, headers=headers, timeout=(3.05, 10))
                 if response.status_code != 200:
                     return []
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, BS_PARSER)
             news_items = []
             
+            now_iso = datetime.now().isoformat()
             # Extract news items from Google Finance
-            articles = soup.select('div.yY3Lee')
+            articles = _GF_ARTICLE_SEL.select(soup)
             for article in articles[:5]:  # Limit to top 5
-                title_tag = article.select_one('.Yfwt5')
+                title_tag = _select_one(_GF_TITLE_SEL, article)
                 title = title_tag.text.strip() if title_tag else ""
                 
-                source_tag = article.select_one('.sfyJob')
+                source_tag = _select_one(_GF_SOURCE_SEL, article)
                 source = source_tag.text.strip() if source_tag else "Google Finance"
                 
                 link_tag = article.parent
@@ -203,7 +318,7 @@ class MultiFetchNewsProvider:
                         description="",
                         source=f"Google Finance: {source}",
                         url=link,
-                        published_at=datetime.now().isoformat()
+                        published_at=now_iso
                     ))
             
             return news_items
@@ -211,59 +326,78 @@ class MultiFetchNewsProvider:
             print(f"Error fetching from Google Finance: {str(e)}")
             return []
 
+    def _fetch_source(self, source, ticker: str, company_name: str) -> List[NewsItem]:
+        """Run one news source through the on-disk cache"""
+        cached = _cache_load(ticker, source.__name__, NEWS_TTL)
+        if cached is not None:
+            return [NewsItem(**item) for item in cached]
+
+        news_items = source(ticker, company_name)
+        if news_items:
+            _cache_store(ticker, source.__name__, [asdict(item) for item in news_items])
+        return news_items
+
     def get_company_news(self, ticker: str, company_name: str) -> List[NewsItem]:
         """
         Get news for a company from multiple sources
         """
-        all_news = []
-        
-        # Use ThreadPoolExecutor to fetch from multiple sources in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all tasks
-            future_to_source = {
-                executor.submit(source, ticker, company_name): source.__name__
-                for source in self.news_sources
-            }
-            
-            # Collect results as they complete
-            for future in future_to_source:
-                try:
-                    news_items = future.result()
-                    all_news.extend(news_items)
-                except Exception as e:
-                    print(f"Error in {future_to_source[future]}: {str(e)}")
-        
-        # Add sentiment analysis to the news items
-        for item in all_news:
-            item.sentiment = self._analyze_sentiment(item.title)
-        
-        # Remove duplicates by title
-        unique_news = {}
-        for item in all_news:
-            if item.title not in unique_news:
-                unique_news[item.title] = item
-        
-        # Return the list of unique news items, prioritizing those with sentiment
-        return list(unique_news.values())
+        # Fetch from all sources in parallel on the shared worker pool
+        future_to_source = {
+            self._fetch_pool.submit(self._fetch_source, source, ticker, company_name): source.__name__
+            for source in self.news_sources
+        }
+
+        # Process each source the moment it finishes so fast sources are
+        # deduplicated and scored while the slow ones are still in flight
+        seen_titles = set()
+        unique_news = []
+        for future in as_completed(future_to_source):
+            try:
+                news_items = future.result()
+            except Exception as e:
+                print(f"Error in {future_to_source[future]}: {str(e)}")
+                continue
+
+            # Drop duplicates on a normalized key so the same story with
+            # different punctuation or casing across sources collapses
+            fresh_items = []
+            for item in news_items:
+                key = re.sub(r'\W+', '', item.title.lower())[:80]
+                if key not in seen_titles:
+                    seen_titles.add(key)
+                    fresh_items.append(item)
+
+            for item, sentiment in zip(fresh_items, self._analyze_sentiments_batch([item.title for item in fresh_items])):
+                item.sentiment = sentiment
+            unique_news.extend(fresh_items)
+
+        return unique_news
     
+    def _analyze_sentiments_batch(self, titles: List[str]) -> List[str]:
+        """Score many titles at once with vectorized string ops
+
+        pandas is imported lazily so single-title callers of
+        _analyze_sentiment never pay for it
+        """
+        if not titles:
+            return []
+
+        import numpy as np
+        import pandas as pd
+
+        lowered = pd.Series(titles, dtype="string").str.lower()
+        pos_counts = lowered.str.count(_POS_RE.pattern)
+        neg_counts = lowered.str.count(_NEG_RE.pattern)
+
+        return list(np.where(pos_counts > neg_counts, "Positive",
+                             np.where(neg_counts > pos_counts, "Negative", "Neutral")))
+
     def _analyze_sentiment(self, text: str) -> str:
         """Simple rule-based sentiment analysis"""
-        positive_words = [
-            "up", "rise", "gain", "profit", "growth", "positive", "surge",
-            "increase", "higher", "rally", "bullish", "outperform", "beat",
-            "exceed", "upgrade", "strong", "top", "soar", "jump"
-        ]
-        
-        negative_words = [
-            "down", "fall", "drop", "loss", "decline", "negative", "plunge",
-            "decrease", "lower", "slip", "bearish", "underperform", "miss",
-            "downgrade", "weak", "bottom", "sink", "crash"
-        ]
-        
         text_lower = text.lower()
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
-        
+        pos_count = len(_POS_RE.findall(text_lower))
+        neg_count = len(_NEG_RE.findall(text_lower))
+
         if pos_count > neg_count:
             return "Positive"
         elif neg_count > pos_count:
@@ -273,12 +407,16 @@ class MultiFetchNewsProvider:
 
     def get_market_data(self, ticker: str) -> Dict[str, Any]:
         """Get current market data for a stock"""
+        cached = _cache_load(ticker, "market_data", MARKET_DATA_TTL)
+        if cached is not None:
+            return cached
+
         # Try Yahoo Finance API
-        headers = {"User-Agent": self._get_random_user_agent()}
+        headers = {"User-Agent": self._source_ua["market_data"]}
         url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}?interval=1d"
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=(3.05, 10))
             if response.status_code != 200:
                 return {}
             
@@ -290,7 +428,7 @@ class MultiFetchNewsProvider:
             quote = result[0].get('indicators', {}).get('quote', [{}])[0]
             meta = result[0].get('meta', {})
             
-            return {
+            market_data = {
                 "current_price": meta.get('regularMarketPrice'),
                 "previous_close": meta.get('previousClose'),
                 "open_price": quote.get('open', [None])[-1],
@@ -300,6 +438,8 @@ class MultiFetchNewsProvider:
                 "currency": meta.get('currency'),
                 "exchange": meta.get('exchangeName')
             }
+            _cache_store(ticker, "market_data", market_data)
+            return market_data
         except Exception as e:
             print(f"Error fetching market data: {str(e)}")
             return {}
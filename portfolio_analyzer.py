@@ -1,8 +1,10 @@
 import json
 import os
+import re
 import sys
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
@@ -15,12 +17,59 @@ try:
 except ImportError:
     MULTI_FETCHER_AVAILABLE = False
 
+# Optional Rust-backed XLSX reader (much faster than openpyxl for value-only reads)
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Optional fast JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dump_json(data, filepath):
+    """Write data as indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f, indent=2)
+
 # Load environment variables
 load_dotenv()
 
 # Get API key from environment variables
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 
+def read_excel_readonly(filepath: str) -> pd.DataFrame:
+    """
+    Load the first worksheet of an Excel file into a DataFrame using
+    python-calamine when available, falling back to openpyxl's streaming
+    read-only mode; both avoid the full in-memory cell tree that
+    pd.read_excel builds by default
+    """
+    if CALAMINE_AVAILABLE:
+        rows = CalamineWorkbook.from_path(filepath).get_sheet_by_index(0).to_python()
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows[1:], columns=rows[0])
+
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(filepath, data_only=True, read_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        return pd.DataFrame(list(rows), columns=list(header))
+    finally:
+        workbook.close()
+
 # Define Pydantic models for our data structures
 class Stock(BaseModel):
     """Model for a stock in the portfolio"""
@@ -61,8 +110,7 @@ class PortfolioAnalysis(BaseModel):
         """Convert the analysis to JSON"""
         data = self.model_dump(mode='json')
         if filepath:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            dump_json(data, filepath)
         return data
 
 class PortfolioAnalyzer:
@@ -72,15 +120,21 @@ class PortfolioAnalyzer:
         self.api_key = api_key or NEWS_API_KEY
         if not self.api_key:
             print("Warning: No NEWS_API_KEY found. Please set it in your .env file.")
-    
-    def extract_portfolio_from_excel(self, filepath: str) -> List[Stock]:
+        # One fetcher for the analyzer's lifetime so its HTTP sessions and
+        # pooled connections are reused across every stock lookup
+        self.news_fetcher = MultiFetchNewsProvider(api_key=self.api_key) if MULTI_FETCHER_AVAILABLE else None
+
+    def extract_portfolio_from_excel(self, filepath: str, use_read_only: bool = True) -> List[Stock]:
         """
         Extract portfolio data from an Excel file
         Tries to handle various formats exported from platforms like Groww
         """
         try:
-            # Read the Excel file
-            df = pd.read_excel(filepath)
+            # Read the Excel file (streaming read-only mode by default)
+            if use_read_only:
+                df = read_excel_readonly(filepath)
+            else:
+                df = pd.read_excel(filepath)
             
             # Check for common column names in various formats
             # Map of standard column names to possible variations
@@ -139,10 +193,9 @@ class PortfolioAnalyzer:
         Get recent news for a specific stock using multiple sources
         """
         # Try the multi-source fetcher first if available
-        if MULTI_FETCHER_AVAILABLE:
+        if self.news_fetcher is not None:
             try:
-                fetcher = MultiFetchNewsProvider(api_key=self.api_key)
-                news_items = fetcher.get_company_news(stock.ticker, stock.name)
+                news_items = self.news_fetcher.get_company_news(stock.ticker, stock.name)
                 
                 # Convert fetcher news items to our format
                 if news_items:
@@ -155,7 +208,7 @@ class PortfolioAnalyzer:
                     ) for item in news_items]
                 
                 # If no news found from multi-source fetcher, try to get market data
-                market_data = fetcher.get_market_data(stock.ticker)
+                market_data = self.news_fetcher.get_market_data(stock.ticker)
                 if market_data and market_data.get('current_price'):
                     # Update stock object with market data
                     stock.current_price = market_data.get('current_price')
@@ -237,6 +290,80 @@ class PortfolioAnalyzer:
             # Fallback for when API key is not provided
             return [self.create_fallback_news_item(stock, no_api=True)]
 
+    def fetch_news_batch(self, stocks: List[Stock], batch_size: int = 20) -> Dict[str, List[NewsItem]]:
+        """
+        Fetch news for many stocks with one NewsAPI call per batch of 20
+        (q=A OR B OR ...) instead of one call per stock, then partition
+        the articles back to stocks by matching names and tickers against
+        each headline and description
+        """
+        if not self.api_key or not stocks:
+            return {}
+
+        url = "https://newsapi.org/v2/everything"
+        results: Dict[str, List[NewsItem]] = {stock.ticker: [] for stock in stocks}
+
+        for start in range(0, len(stocks), batch_size):
+            batch = stocks[start:start + batch_size]
+
+            params = {
+                "q": " OR ".join(f'"{stock.name}"' for stock in batch),
+                "apiKey": self.api_key,
+                "language": "en",
+                "sortBy": "publishedAt",
+                "pageSize": 100
+            }
+
+            try:
+                response = requests.get(url, params=params)
+                data = response.json()
+            except Exception as e:
+                print(f"Error fetching batched news: {str(e)}")
+                continue
+
+            if response.status_code != 200 or not data.get("articles"):
+                continue
+
+            # Compile every name/ticker into one alternation so each
+            # article is scanned a single time instead of once per stock
+            needles = {}
+            for stock in batch:
+                needles[stock.name.lower()] = stock
+                needles[stock.ticker.lower()] = stock
+            needles.pop("", None)
+            matcher = re.compile("|".join(
+                map(re.escape, sorted(needles, key=len, reverse=True))))
+
+            for article in data["articles"]:
+                text = f"{article.get('title') or ''} {article.get('description') or ''}".lower()
+
+                item = None
+                seen = set()
+                for match in matcher.finditer(text):
+                    stock = needles[match.group(0)]
+                    if stock.ticker in seen:
+                        continue
+                    seen.add(stock.ticker)
+
+                    if item is None:
+                        item = NewsItem(
+                            title=article.get("title", ""),
+                            description=article.get("description", ""),
+                            source=article.get("source", {}).get("name", ""),
+                            url=article.get("url", ""),
+                            published_at=article.get("publishedAt", "")
+                        )
+                    # Cap per stock to mirror the single-stock pageSize
+                    if len(results[stock.ticker]) < 5:
+                        results[stock.ticker].append(item)
+
+        # Stocks with no matched articles still get the standard fallback
+        for stock in stocks:
+            if not results[stock.ticker]:
+                results[stock.ticker] = [self.create_fallback_news_item(stock)]
+
+        return results
+
     def create_fallback_news_item(self, stock: Stock, error=None, no_api=False) -> NewsItem:
         """Create a fallback news item with some basic market information"""
         # Determine a basic fallback message based on stock information
@@ -369,55 +496,74 @@ class PortfolioAnalyzer:
             print(f"Error fetching sector news for {sector}: {str(e)}")
             return []
     
-    def analyze_portfolio(self, stocks: List[Stock]) -> PortfolioAnalysis:
+    def analyze_stock(self, stock: Stock, news_items: Optional[List[NewsItem]] = None) -> StockAnalysis:
         """
-        Analyze a portfolio of stocks and return insights
+        Fetch news and assess the impact for a single stock
+        Callers that already fetched news in a batch pass it in to skip
+        the per-stock lookup
         """
-        analysis_results = []
-        
-        for stock in stocks:
-            # Get news for the stock
+        # Get news for the stock
+        if news_items is None:
             news_items = self.get_stock_news(stock)
-            
-            # If no specific company news found, try to get sector news
-            if not news_items and stock.sector:
-                sector_news = self.get_sector_news(stock.sector)
-                if sector_news:
-                    news_items = sector_news
-            
-            # Assess the impact
-            impact = self.assess_impact(news_items)
-            
-            # Main news summary (first item or default message)
-            if news_items:
-                main_news = news_items[0].title
-                additional_news = news_items[1:] if len(news_items) > 1 else []
-            else:
-                main_news = f"No significant news found for {stock.name}"
-                additional_news = []
-            
-            # Add to results
-            analysis_results.append(StockAnalysis(
-                stock=stock.name,
-                ticker=stock.ticker,
-                sector=stock.sector,
-                news_summary=main_news,
-                impact=impact,
-                additional_news=additional_news
-            ))
-        
+
+        # If no specific company news found, try to get sector news
+        if not news_items and stock.sector:
+            sector_news = self.get_sector_news(stock.sector)
+            if sector_news:
+                news_items = sector_news
+
+        # Assess the impact
+        impact = self.assess_impact(news_items)
+
+        # Main news summary (first item or default message)
+        if news_items:
+            main_news = news_items[0].title
+            additional_news = news_items[1:] if len(news_items) > 1 else []
+        else:
+            main_news = f"No significant news found for {stock.name}"
+            additional_news = []
+
+        return StockAnalysis(
+            stock=stock.name,
+            ticker=stock.ticker,
+            sector=stock.sector,
+            news_summary=main_news,
+            impact=impact,
+            additional_news=additional_news
+        )
+
+    def analyze_portfolio(self, stocks: List[Stock], max_workers: int = 10) -> PortfolioAnalysis:
+        """
+        Analyze a portfolio of stocks and return insights
+        News for all stocks is fetched concurrently since the work is
+        network-bound; results keep the original portfolio order
+        """
+        if not stocks:
+            return PortfolioAnalysis(stocks=[], timestamp=datetime.now().isoformat())
+
+        # When only NewsAPI is available, fetch news in batches of 20
+        # stocks per call up front - far fewer round trips under the
+        # provider's rate limits than one request per stock
+        prefetched = {}
+        if self.news_fetcher is None and self.api_key:
+            prefetched = self.fetch_news_batch(stocks)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(stocks))) as executor:
+            analysis_results = list(executor.map(
+                lambda stock: self.analyze_stock(stock, prefetched.get(stock.ticker)), stocks))
+
         # Create the portfolio analysis
         return PortfolioAnalysis(
             stocks=analysis_results,
             timestamp=datetime.now().isoformat()
         )
     
-    def analyze_from_excel(self, excel_path: str) -> PortfolioAnalysis:
+    def analyze_from_excel(self, excel_path: str, use_read_only: bool = True) -> PortfolioAnalysis:
         """
         Read portfolio from Excel and analyze it
         """
         # Extract stocks from Excel
-        stocks = self.extract_portfolio_from_excel(excel_path)
+        stocks = self.extract_portfolio_from_excel(excel_path, use_read_only=use_read_only)
         
         if not stocks:
             print(f"No valid stocks found in {excel_path}")
@@ -11,8 +11,12 @@ import json
 import base64
 from datetime import datetime
 from pathlib import Path
+import matplotlib
+matplotlib.use('Agg', force=True)  # headless rendering; skip GUI backend probing
 import matplotlib.pyplot as plt
 
+plt.ioff()
+
 # Import analyzers
 from mutual_fund_analyzer import MutualFundAnalyzer
 from portfolio_analyzer import PortfolioAnalyzer